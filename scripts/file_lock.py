@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import fcntl
+import os
+
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def file_lock(lock_file: Path, shared=False, blocking=True):
+    """
+    Holds an advisory lock on lock_file. A shared lock can be held by several
+    processes at the same time, an exclusive lock by only one.
+
+    Locks are released by the system if the process ends, so they're never
+    stale. Without blocking, raises BlockingIOError if the lock is held.
+    """
+    lock_file = Path(lock_file)
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    # Lock files are never removed, another process might be waiting on them
+    fd = os.open(lock_file, os.O_CREAT | os.O_RDWR)
+    try:
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            operation |= fcntl.LOCK_NB
+        fcntl.flock(fd, operation)
+        yield
+    finally:
+        # Closing the file releases the lock
+        os.close(fd)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+import textwrap
+
+from pathlib import Path
+
+from custom_html_parser import MyHTMLParser
+from fluent.syntax import ast, parse
+from fluent.syntax.serializer import serialize_expression, serialize_pattern
+
+
+class FluentSource:
+    """
+    Reads Fluent strings directly from .ftl files. Each file is parsed once,
+    and the values used by TMX checks (HTML markup, function calls, string
+    literals, data-l10n-name attributes) are derived from the AST.
+
+    String IDs use the same format as TMX caches (path/to/file.ftl:message,
+    path/to/file.ftl:message.attribute).
+    """
+
+    def __init__(self, datal10n_pattern):
+        self.datal10n_pattern = datal10n_pattern
+        self.html_parser = MyHTMLParser()
+
+    def load_tree(self, base_path: Path, keep=None):
+        """
+        Returns texts and derived facts for all messages in the .ftl files
+        in base_path, only storing string IDs accepted by keep (a function).
+        """
+        base_path = Path(base_path)
+        texts = {}
+        facts = {}
+        for ftl_file in sorted(base_path.rglob("*.ftl")):
+            file_id = ftl_file.relative_to(base_path).as_posix()
+            try:
+                resource = parse(ftl_file.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error reading {ftl_file}: {e}")
+                continue
+
+            for entry in resource.body:
+                if not isinstance(entry, (ast.Message, ast.Term)):
+                    continue
+                name = entry.id.name
+                if isinstance(entry, ast.Term):
+                    name = f"-{name}"
+                patterns = [(f"{file_id}:{name}", entry.value)]
+                patterns += [
+                    (f"{file_id}:{name}.{attr.id.name}", attr.value)
+                    for attr in entry.attributes
+                ]
+                for string_id, pattern in patterns:
+                    if pattern is None or (keep and not keep(string_id)):
+                        continue
+                    texts[string_id] = textwrap.dedent(
+                        serialize_pattern(pattern).lstrip("\n")
+                    ).strip()
+                    facts[string_id] = self.analyze(pattern, texts[string_id])
+
+        return texts, facts
+
+    def analyze(self, pattern, text):
+        function_calls = []
+        has_literal = False
+        for node in self._iter_expressions(pattern):
+            if isinstance(node, ast.StringLiteral):
+                has_literal = True
+            elif isinstance(node, ast.FunctionReference) and node.id.name in (
+                "NUMBER",
+                "DATETIME",
+            ):
+                params = [serialize_expression(a) for a in node.arguments.positional]
+                params += [
+                    f"{a.name.name}: {serialize_expression(a.value)}"
+                    for a in node.arguments.named
+                ]
+                call = [node.id.name] + sorted(params)
+                if call not in function_calls:
+                    function_calls.append(call)
+
+        self.html_parser.clear()
+        self.html_parser.feed(self._default_text(pattern))
+
+        return {
+            "HTML": self.html_parser.get_tags(),
+            "Fluent functions": sorted(function_calls),
+            "data-l10n-name": sorted(set(self.datal10n_pattern.findall(text))),
+            "literal": has_literal,
+        }
+
+    def _default_text(self, pattern):
+        """Text of the pattern without placeables, using default variants."""
+        text = ""
+        for element in pattern.elements:
+            if isinstance(element, ast.TextElement):
+                text += element.value
+                continue
+            expression = element.expression
+            while isinstance(expression, ast.Placeable):
+                expression = expression.expression
+            if isinstance(expression, ast.SelectExpression):
+                for variant in expression.variants:
+                    if variant.default:
+                        text += self._default_text(variant.value)
+
+        return text
+
+    def _iter_expressions(self, node):
+        """Yields all expressions in a pattern, including nested ones."""
+        if isinstance(node, ast.Pattern):
+            for element in node.elements:
+                if isinstance(element, ast.Placeable):
+                    yield from self._iter_expressions(element.expression)
+        elif isinstance(node, ast.Placeable):
+            yield from self._iter_expressions(node.expression)
+        elif isinstance(node, ast.SelectExpression):
+            yield from self._iter_expressions(node.selector)
+            for variant in node.variants:
+                yield from self._iter_expressions(variant.value)
+        else:
+            yield node
+            if isinstance(node, ast.FunctionReference):
+                for argument in node.arguments.positional:
+                    yield from self._iter_expressions(argument)
+
+
+def is_ftl_id(string_id):
+    return re.match(r"[^:]+\.ftl:", string_id) is not None
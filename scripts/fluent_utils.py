@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from fluent.syntax import visitor
+
+
+class flattenSelectExpression(visitor.Transformer):
+    def visit_SelectExpression(self, node):
+        default_variant = None
+        for variant in node.variants:
+            if variant.default:
+                default_variant = variant
+                break
+        if default_variant:
+            node.variants = [default_variant]
+
+        return node
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+
+
+# Variables in Fluent strings ({ $var }, { -term }, { $var -> ... })
+FTL_PATTERNS = [
+    re.compile(
+        r"(?<!\{)\{\s*([\$-]?[A-Za-z0-9._-]++)(?:[\[(]?[A-Za-z0-9_\- :\"]++[\])])*+\s*\}"
+    ),
+    re.compile(r"\{\s*(\$[A-Za-z0-9._-]+)\s*->"),
+]
+
+# Variables in other formats (DTD entities, printf, $var, {{var}})
+LEGACY_PATTERNS = [
+    re.compile(r"&([a-z0-9\.]+);", re.IGNORECASE),
+    re.compile(r"(%(?:[0-9]+\$){0,1}(?:[0-9].){0,1}[sS])"),
+    re.compile(r"(?<!%[0-9])(\$[a-z0-9\.]+)\b", re.IGNORECASE),
+    re.compile(r"\{\{\s*([a-z0-9_]+)\s*\}\}", re.IGNORECASE),
+]
+
+# Keyboard shortcuts (.key, .commandkey, commandkey2, etc.)
+SHORTCUT_PATTERN = re.compile(r"(?:^|[._-])(?:command)?key\d*$", re.IGNORECASE)
+
+# Characters needed for any variable, used to skip most strings quickly
+VARIABLE_CHARS = re.compile(r"[{$%&]")
+
+
+class LocalViews:
+    """
+    Computes the Transvision views (variables, shortcuts, empty strings) on
+    TMX caches, returning the same list of string IDs as the views.
+
+    The en-US data is indexed once: variables are only extracted from
+    translations of strings in the reference, and shortcuts are looked up
+    from the list of keyboard shortcut IDs.
+    """
+
+    def __init__(self, reference_data):
+        self.reference = reference_data
+        self.reference_variables = {
+            sid: self.get_variables(sid, text) for sid, text in reference_data.items()
+        }
+        self.shortcut_ids = [
+            sid
+            for sid in reference_data
+            if SHORTCUT_PATTERN.search(sid.split(":", 1)[1])
+        ]
+
+    @staticmethod
+    def get_variables(string_id, text):
+        if not VARIABLE_CHARS.search(text):
+            return set()
+
+        patterns = (
+            FTL_PATTERNS
+            if string_id.split(":")[0].endswith(".ftl")
+            else LEGACY_PATTERNS
+        )
+        return {m for pattern in patterns for m in pattern.findall(text)}
+
+    @staticmethod
+    def is_empty(text):
+        # Empty Fluent strings are stored as an empty literal
+        return text == "" or text == '{ "" }'
+
+    def variables(self, locale_data):
+        """String IDs with different variables than en-US."""
+        return [
+            sid
+            for sid, variables in self.reference_variables.items()
+            if sid in locale_data
+            and not self.is_empty(locale_data[sid])
+            and self.get_variables(sid, locale_data[sid]) != variables
+        ]
+
+    def shortcuts(self, locale_data):
+        """String IDs of keyboard shortcuts different from en-US."""
+        return [
+            sid
+            for sid in self.shortcut_ids
+            if sid in locale_data
+            and locale_data[sid].lower() != self.reference[sid].lower()
+        ]
+
+    def empty(self, locale_data):
+        """String IDs empty either in en-US or in the translation."""
+        return [
+            sid
+            for sid, text in self.reference.items()
+            if sid in locale_data
+            and self.is_empty(locale_data[sid]) != self.is_empty(text)
+        ]
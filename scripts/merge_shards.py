@@ -0,0 +1,97 @@
+#! /usr/bin/env python3
+
+import argparse
+import json
+import sys
+
+from pathlib import Path
+
+from qualitychecks import (
+    ROOT_DIR,
+    ResultsArchiver,
+    ResultsContainer,
+    merge_summaries,
+    run_lock,
+    save_findings,
+)
+
+
+def load_shards(shard_files):
+    """Loads partial results, checking that all shards of a run are present."""
+    shards = {}
+    for shard_file in shard_files:
+        try:
+            with open(shard_file, encoding="utf-8") as f:
+                shard_data = json.load(f)
+        except Exception as e:
+            sys.exit(f"Error loading shard file {shard_file}: {e}")
+        index, count = shard_data["shard"]
+        if index in shards:
+            sys.exit(f"ERROR: shard {index}/{count} provided more than once.")
+        shards[index] = shard_data
+
+    counts = {s["shard"][1] for s in shards.values()}
+    if len(counts) != 1:
+        sys.exit("ERROR: shard files belong to runs with a different number of shards.")
+    count = counts.pop()
+    missing = [str(i) for i in range(1, count + 1) if i not in shards]
+    if missing:
+        sys.exit(f"ERROR: missing shards {', '.join(missing)} (of {count}).")
+    locales = shards[1]["locales"]
+    if any(s["locales"] != locales for s in shards.values()):
+        sys.exit("ERROR: shard files were generated with different locales.")
+
+    return [shards[i] for i in range(1, count + 1)]
+
+
+def merge_shards(shards):
+    """Combines partial results, following the locale order of a single run."""
+    merged = ResultsContainer(shards[0]["locales"])
+    for shard_data in shards:
+        results = ResultsContainer.from_dict(shard_data["results"])
+        for locale, errors in results.error_messages.items():
+            merged.error_messages[locale].extend(errors)
+        merge_summaries(merged.error_summary, results.error_summary)
+        for msg_type in ("errors", "warnings"):
+            merged.output_cl[msg_type].update(results.output_cl[msg_type])
+        merged.findings.extend(results.findings)
+        # API checks are not sharded, so each shard reports the same errors
+        for error in results.general_errors:
+            if error not in merged.general_errors:
+                merged.general_errors.append(error)
+
+    return merged
+
+
+def main():
+    cl_parser = argparse.ArgumentParser(
+        description="Merge partial results from qualitychecks.py --shard and "
+        "compare them with the previous run"
+    )
+    cl_parser.add_argument("shard_files", nargs="+", help="Partial results files")
+    cl_parser.add_argument(
+        "--output",
+        nargs="?",
+        help="Path to folder where to store output in JSON format",
+        default="",
+    )
+    args = cl_parser.parse_args()
+
+    merged = merge_shards(load_shards(args.shard_files))
+    if merged.general_errors:
+        print(f"General errors ({len(merged.general_errors)} errors):")
+        print("\n".join(sorted(merged.general_errors)))
+
+    # Merged results replace the results of a full run
+    with run_lock(ROOT_DIR, "full", [args.output] if args.output else []):
+        archiver = ResultsArchiver(root_folder=Path(ROOT_DIR), output_path=args.output)
+        archiver.archive(
+            current_error_messages=merged.error_messages,
+            output_cl=merged.output_cl,
+            error_summary=merged.error_summary,
+        )
+        save_findings(ROOT_DIR, list(merged.error_messages), merged.findings)
+
+
+if __name__ == "__main__":
+    main()
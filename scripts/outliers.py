@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import math
+import re
+import statistics
+import warnings
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from local_views import LocalViews
+from tmx_cache import iter_cache
+
+
+# NumPy is part of requirements.txt, outliers are found with a slower loop
+# over strings without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+MARKUP_PATTERN = re.compile(r"<[a-zA-Z/][^<>]*>")
+
+# Features compared across locales: length ratio to en-US (as a logarithm),
+# number of placeables, number of markup elements
+FEATURES = ("length", "placeables", "markup")
+
+MISSING = float("nan")
+
+# en-US strings shorter than this are not checked for length
+MIN_LENGTH = 10
+# Minimum number of translations of a string to compare locales
+MIN_LOCALES = 5
+# Lengths are only reported if this many times longer or shorter than the
+# median across locales
+LENGTH_FACTOR = 3
+# Modified z-score above which a length is an outlier
+Z_THRESHOLD = 3.5
+
+MESSAGES = {
+    ("length", True): "Translation much longer than in other locales ({})",
+    ("length", False): "Translation much shorter than in other locales ({})",
+    ("placeables", True): "More placeables than en-US and other locales ({})",
+    ("placeables", False): "Fewer placeables than en-US and other locales ({})",
+    ("markup", True): "More markup elements than en-US and other locales ({})",
+    ("markup", False): "Fewer markup elements than en-US and other locales ({})",
+}
+
+
+def get_features(string_id, text):
+    """Returns the number of characters, placeables and markup elements."""
+    markup = len(MARKUP_PATTERN.findall(text)) if "<" in text else 0
+
+    return len(text), len(LocalViews.get_variables(string_id, text)), markup
+
+
+class OutlierDetector:
+    """
+    Compares the translations of each string across all locales.
+
+    Features are stored in columns (one array per locale and feature, with a
+    row for each en-US string). Each string is compared with the median of
+    all locales: lengths far from the median (relative to en-US) are
+    reported, as well as counts of placeables and markup different from the
+    median, when most locales match en-US.
+
+    Columns are kept between calls to load(), and only read again for
+    locales whose TMX cache changed.
+    """
+
+    def __init__(self, reference_data):
+        self.ids = list(reference_data)
+        self.positions = {string_id: i for i, string_id in enumerate(self.ids)}
+        self.reference = {feature: array("f") for feature in FEATURES}
+        for string_id, text in reference_data.items():
+            for feature, value in zip(
+                FEATURES, get_features(string_id, text), strict=True
+            ):
+                self.reference[feature].append(value)
+        # Columns for each locale ({locale: {feature: array}}), and signature
+        # of the TMX cache they were read from
+        self.columns = {}
+        self.signatures = {}
+
+    def __getstate__(self):
+        # Worker processes only need the reference, not the loaded columns
+        return dict(self.__dict__, columns={}, signatures={})
+
+    def get_locale_columns(self, cache_file):
+        columns = {
+            feature: array("f", [MISSING]) * len(self.ids) for feature in FEATURES
+        }
+        reference_lengths = self.reference["length"]
+        for string_id, text in iter_cache(cache_file):
+            i = self.positions.get(string_id)
+            if i is None or LocalViews.is_empty(text):
+                continue
+            length, placeables, markup = get_features(string_id, text)
+            if reference_lengths[i] >= MIN_LENGTH:
+                columns["length"][i] = math.log(length / reference_lengths[i])
+            columns["placeables"][i] = placeables
+            columns["markup"][i] = markup
+
+        return columns
+
+    def load(self, cache_files, workers=1):
+        """
+        Loads the features of each locale ({locale: TMX cache}), if its cache
+        changed since the last call. Other locales are removed.
+        """
+        signatures = {}
+        for locale, cache_file in cache_files.items():
+            stat = cache_file.stat()
+            signatures[locale] = (stat.st_mtime_ns, stat.st_size)
+        for locale in set(self.columns) - set(cache_files):
+            del self.columns[locale]
+            del self.signatures[locale]
+        changed = {
+            locale: cache_file
+            for locale, cache_file in cache_files.items()
+            if self.signatures.get(locale) != signatures[locale]
+        }
+
+        if workers > 1 and len(changed) > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self,)
+            ) as executor:
+                self.columns.update(
+                    executor.map(_load_locale, changed.items(), chunksize=4)
+                )
+        else:
+            for locale, cache_file in changed.items():
+                self.columns[locale] = self.get_locale_columns(cache_file)
+        for locale in changed:
+            self.signatures[locale] = signatures[locale]
+
+        return len(changed)
+
+    def _find(self, feature, columns):
+        """Yields (row, column, above median) for each outlier of a feature."""
+        if numpy is not None:
+            yield from self._find_vectorized(feature, columns)
+            return
+
+        reference = self.reference[feature]
+        for i in range(len(self.ids)):
+            values = [column[i] for column in columns]
+            present = [v for v in values if not math.isnan(v)]
+            if len(present) < MIN_LOCALES:
+                continue
+            median = statistics.median(present)
+            if feature == "length":
+                mad = statistics.median(abs(v - median) for v in present)
+                limit = max(math.log(LENGTH_FACTOR), Z_THRESHOLD * 1.4826 * mad)
+                outliers = (abs(v - median) > limit for v in values)
+            elif median == reference[i]:
+                outliers = (not math.isnan(v) and v != median for v in values)
+            else:
+                continue
+            for col, is_outlier in enumerate(outliers):
+                if is_outlier:
+                    yield i, col, values[col] > median
+
+    def _find_vectorized(self, feature, columns):
+        matrix = numpy.stack(
+            [numpy.frombuffer(column, dtype=numpy.float32) for column in columns],
+            axis=1,
+        )
+        present = ~numpy.isnan(matrix)
+        with warnings.catch_warnings():
+            # Rows without values have a NaN median
+            warnings.simplefilter("ignore", RuntimeWarning)
+            median = numpy.nanmedian(matrix, axis=1)
+            deviation = matrix - median[:, None]
+            if feature == "length":
+                mad = numpy.nanmedian(numpy.abs(deviation), axis=1)
+                limit = numpy.maximum(
+                    math.log(LENGTH_FACTOR), Z_THRESHOLD * 1.4826 * mad
+                )
+                outliers = numpy.abs(deviation) > limit[:, None]
+            else:
+                reference = numpy.frombuffer(self.reference[feature], numpy.float32)
+                outliers = (deviation != 0) & present & (median == reference)[:, None]
+        outliers &= (present.sum(axis=1) >= MIN_LOCALES)[:, None]
+
+        for i, col in zip(*numpy.nonzero(outliers), strict=True):
+            yield int(i), int(col), bool(deviation[i, col] > 0)
+
+    def find_outliers(self, locales):
+        """
+        Returns (string ID, error message) pairs for each locale, in order of
+        string IDs.
+        """
+        all_locales = list(self.columns)
+        found = {locale: [] for locale in locales}
+        for feature in FEATURES:
+            columns = [self.columns[locale][feature] for locale in all_locales]
+            for i, col, above in self._find(feature, columns):
+                if all_locales[col] in found:
+                    found[all_locales[col]].append((i, FEATURES.index(feature), above))
+
+        return {
+            locale: [
+                (self.ids[i], MESSAGES[FEATURES[feature], above].format(self.ids[i]))
+                for i, feature, above in sorted(outliers)
+            ]
+            for locale, outliers in found.items()
+        }
+
+
+# State of worker processes, set once per process to avoid sending the
+# reference data with each locale
+_worker_detector = None
+
+
+def _init_worker(detector):
+    global _worker_detector
+    _worker_detector = detector
+
+
+def _load_locale(item):
+    locale, cache_file = item
+    return locale, _worker_detector.get_locale_columns(cache_file)
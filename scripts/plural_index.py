@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+
+from pathlib import Path
+
+
+# Start of a localization note, optionally with the keys it refers to
+NOTE_PATTERN = re.compile(r"LOCALIZATION NOTE\s*(?:\(([^)]*)\))?", re.IGNORECASE)
+# Notes of plural strings, e.g. "Semi-colon list of plural forms", or a link
+# to the documentation of PluralForm
+PLURAL_PATTERN = re.compile(
+    r"plural\s*forms?\b|PluralForm|Localization_and_Plurals", re.IGNORECASE
+)
+ENTITY_PATTERN = re.compile(r"\s*([^#!\s=:][^\s=:]*)\s*[=:]")
+
+
+def get_plural_keys(text):
+    """
+    Returns the keys of plural strings in a .properties file, based on their
+    localization notes. Notes without keys refer to the following string.
+    """
+    keys = set()
+    note = None
+    continued = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if continued:
+            # Continuation of a multi-line value
+            continued = stripped.endswith("\\")
+            continue
+        if stripped.startswith(("#", "!")):
+            match = NOTE_PATTERN.search(stripped)
+            if match:
+                note = [match.group(1), stripped]
+            elif note is not None:
+                note[1] += f" {stripped}"
+            continue
+
+        match = ENTITY_PATTERN.match(line)
+        if match is None:
+            continue
+        continued = stripped.endswith("\\")
+        if note is not None and PLURAL_PATTERN.search(note[1]):
+            if note[0]:
+                keys.update(k for k in re.split(r"[\s,]+", note[0]) if k)
+            else:
+                keys.add(match.group(1))
+        note = None
+
+    return keys
+
+
+class PluralIndex:
+    """
+    IDs of plural strings in .properties files (plural forms separated by
+    semicolons), found from localization notes in the en-US repository and
+    from "plural_forms" rules in checks/*.json.
+
+    Strings found from notes are only kept if the en-US text has two forms,
+    like any English plural string.
+    """
+
+    def __init__(self, enus_path, reference_data, rules=()):
+        self.rules = {}
+        for properties_file in sorted(Path(enus_path).rglob("*.properties")):
+            file_id = properties_file.relative_to(enus_path).as_posix()
+            try:
+                text = properties_file.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error reading {properties_file}: {e}")
+                continue
+            for key in get_plural_keys(text):
+                string_id = f"{file_id}:{key}"
+                if len(reference_data.get(string_id, "").split(";")) == 2:
+                    self.rules[string_id] = {}
+
+        # Rules can exclude or include locales
+        for rule in rules:
+            string_id = f"{rule['file']}:{rule['entity']}"
+            if string_id in reference_data:
+                self.rules[string_id] = rule
+        self.ids = sorted(self.rules)
+
+    def __contains__(self, string_id):
+        return string_id in self.rules
+
+    def __len__(self):
+        return len(self.ids)
+
+    def validate(self, locale, locale_data, num_plurals):
+        """Returns errors for strings without num_plurals forms."""
+        errors = []
+        for string_id in self.ids:
+            if string_id not in locale_data:
+                continue
+            rule = self.rules[string_id]
+            if locale in rule.get("excluded_locales", []):
+                continue
+            if "included_locales" in rule and locale not in rule["included_locales"]:
+                continue
+
+            num_forms = len(locale_data[string_id].split(";"))
+            if num_forms != num_plurals:
+                errors.append(
+                    f"String has {num_forms} plural forms, requested: {num_plurals} "
+                    f"({string_id})"
+                )
+
+        return errors
@@ -7,36 +7,69 @@ import json
 import os
 import pickle
 import re
+import shutil
 import sys
+import threading
+import time
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from configparser import ConfigParser
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager, nullcontext
 from pathlib import Path
 from typing import Any
-from urllib.request import urlopen
-
-from compare_locales.compare import compareProjects
-from compare_locales.paths import ConfigNotFound, TOMLParser
-from fluent.syntax import parse, visitor
-from fluent.syntax.serializer import FluentSerializer
 
 
 # Define the root directory relative to the script location
 ROOT_DIR = Path(__file__).resolve().parent.parent
 
+# Findings of the last run before applying exceptions
+FINDINGS_FILE = "last_findings.json"
+
+# Types of checks evaluated on all strings of the TMX caches, instead of a
+# single string via Transvision API
+CORPUS_CHECK_TYPES = ("corpus_not_include_regex",)
+
+
+def get_run_name(shard=None, locale=None, requested_check="all", phases=None):
+    """
+    Identifies the kind of run (all locales, single locale, shard), and the
+    phases selected with --phase, if not all of them.
+    """
+    if shard:
+        run_name = "shard-{}-of-{}".format(*shard)
+    elif locale:
+        run_name = f"locale-{locale}"
+    else:
+        run_name = "full"
+    if requested_check != "all":
+        run_name += f"-{requested_check}"
+    if phases and set(phases) != set(CHECK_PROVIDERS):
+        run_name += "-phase-" + "+".join(p for p in CHECK_PROVIDERS if p in phases)
+
+    return run_name
+
 
 @contextmanager
-def execution_lock(lock_file: Path):
-    """Ensures a lock file exists during execution and is cleaned up after."""
-    if lock_file.exists():
-        sys.exit("Checks are already running.")
-    try:
-        lock_file.touch()
+def run_lock(root_folder: Path, run_name, output_folders=()):
+    """
+    Ensures that only one run of each kind (see get_run_name) and for each
+    output folder is running, since they write the same files. Runs of
+    different kinds (e.g. a single locale during a full run) can run at the
+    same time.
+    """
+    from file_lock import file_lock
+
+    lock_files = [Path(root_folder) / ".locks" / f"{run_name}.lock"]
+    lock_files += [Path(folder) / ".qualitychecks.lock" for folder in output_folders]
+    with ExitStack() as stack:
+        # Always lock in the same order, to avoid deadlocks
+        for lock_file in sorted(set(lock_files)):
+            try:
+                stack.enter_context(file_lock(lock_file, blocking=False))
+            except BlockingIOError:
+                sys.exit(f"Checks are already running ({lock_file}).")
         yield
-    finally:
-        if lock_file.exists():
-            lock_file.unlink()
 
 
 def load_config(config_path: Path):
@@ -52,76 +85,459 @@ def load_config(config_path: Path):
             "tmx_path": Path(config.get("config", "tmx_path")),
             "firefoxl10n_path": Path(config.get("config", "firefoxl10n_path")),
             "toml_path": Path(config.get("config", "toml_path")),
+            "enus_path": config.get("config", "enus_path", fallback=""),
+            "products": [
+                {
+                    "name": section.split(":", 1)[1],
+                    "toml_path": config.get(section, "toml_path"),
+                    "excluded_products": tuple(
+                        p.strip()
+                        for p in config.get(
+                            section, "excluded_products", fallback=""
+                        ).split(",")
+                        if p.strip()
+                    ),
+                    "output_path": config.get(section, "output", fallback=""),
+                    "l10n_path": config.get(section, "l10n_path", fallback=""),
+                }
+                for section in config.sections()
+                if section.startswith("product:")
+            ],
         }
     except Exception as e:
         sys.exit(f"Configuration error: {e}")
 
 
+def get_num_plurals(locale):
+    """Returns the number of plural forms of a locale."""
+    from compare_locales.plurals import get_plural
+
+    plurals = get_plural(locale)
+    if plurals is None:
+        # Temporary fix for szl
+        if locale == "szl":
+            return 3
+        # Fall back to English (2 plural forms)
+        return 2
+
+    return len(plurals)
+
+
+def get_string_id(message):
+    """Returns the string ID referenced by an error message, if any."""
+    # Most checks end messages with (file:id), views use "view: file:id"
+    match = re.search(r"\(([^\s()]+:[^\s()]+)\)$", message) or re.match(
+        r"[\w-]+: ([^\s]+:[^\s]+)$", message
+    )
+    return match.group(1) if match else None
+
+
+class ResultsSink:
+    """
+    Appends errors to a JSON Lines file while checks are running, one record
+    per error with phase, locale, check and message. Findings (see
+    ResultsContainer) are appended to a separate file, e.g.
+    results_findings.jsonl for results.jsonl.
+
+    The sink can be shared by threads and sent to other processes: each
+    process opens the files in append mode and writes records in one call.
+    """
+
+    def __init__(self, stream_file: Path):
+        self.__setstate__({"stream_file": Path(stream_file)})
+        self.stream_file.write_text("")
+        self.findings_file.write_text("")
+
+    def __getstate__(self):
+        return {"stream_file": self.stream_file}
+
+    def __setstate__(self, state):
+        self.stream_file = state["stream_file"]
+        self.findings_file = self.stream_file.with_name(
+            f"{self.stream_file.stem}_findings.jsonl"
+        )
+        self._fds = {}
+        self._lock = threading.Lock()
+
+    def _append(self, path, records):
+        lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with self._lock:
+            if path not in self._fds:
+                self._fds[path] = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+            os.write(self._fds[path], lines.encode("utf-8"))
+
+    def write(self, phase, locale, check, messages, product=None):
+        """Messages only relevant to one product also store its name."""
+        record = {"phase": phase, "locale": locale, "check": check}
+        if product:
+            record["product"] = product
+        self._append(self.stream_file, (dict(record, message=m) for m in messages))
+
+    def write_findings(self, findings):
+        self._append(self.findings_file, findings)
+
+    def close(self):
+        with self._lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds = {}
+
+    def iter_records(self):
+        with open(self.stream_file, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def iter_findings(self):
+        with open(self.findings_file, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def read_results(self, locales):
+        """Rebuilds results from the stream (e.g. to print them)."""
+        results = ResultsContainer(locales)
+        for record in self.iter_records():
+            if record["phase"] == "compare-locales":
+                results.output_cl[record["check"]].setdefault(
+                    record["locale"], []
+                ).append(record["message"])
+            else:
+                results.error_messages.setdefault(record["locale"], []).append(
+                    record["message"]
+                )
+
+        return results
+
+
+class ResultsContainer:
+    """
+    Errors collected by a phase of checks. If a sink is provided, errors are
+    written to it instead of being stored, and only counted.
+    """
+
+    def __init__(self, locales, sink=None):
+        self.error_messages = OrderedDict((locale, []) for locale in locales)
+        self.error_counts = OrderedDict((locale, 0) for locale in locales)
+        self.error_summary = {}
+        self.output_cl = {"errors": {}, "warnings": {}}
+        self.general_errors = []
+        self.sink = sink
+        # Counters for run metrics (requests, strings checked, etc.)
+        self.stats = {}
+        # Duration of each unit of work ({"phase/unit": seconds})
+        self.unit_durations = {}
+        # Findings of TMX checks and views before applying exceptions, with
+        # their string ID and whether they were reported (see what_if.py).
+        # With a sink, they're written to it instead.
+        self.findings = []
+
+    def count(self, counter, value=1):
+        self.stats[counter] = self.stats.get(counter, 0) + value
+
+    def add_errors(self, locale, errors, phase, check):
+        """Stores errors for a locale, check is the name used in the summary."""
+        self.error_counts[locale] = self.error_counts.get(locale, 0) + len(errors)
+        if self.sink is not None:
+            self.sink.write(phase, locale, check, errors)
+        else:
+            self.error_messages.setdefault(locale, []).extend(errors)
+
+    def add_cl_messages(self, msg_type, locale, messages, product=None):
+        """Stores compare-locales errors or warnings for a locale."""
+        if self.sink is not None:
+            self.sink.write("compare-locales", locale, msg_type, messages, product)
+        else:
+            self.output_cl[msg_type][locale] = messages
+
+    def add_results(self, unit, phase, check, product=None):
+        """Adds results from a unit of work, all related to the same check."""
+        for locale, errors in unit.error_messages.items():
+            if errors:
+                self.add_errors(locale, errors, phase, check)
+        for msg_type, messages in unit.output_cl.items():
+            for locale, msgs in messages.items():
+                self.add_cl_messages(msg_type, locale, msgs, product)
+        merge_summaries(self.error_summary, unit.error_summary)
+        self.general_errors.extend(unit.general_errors)
+        for counter, value in unit.stats.items():
+            self.count(counter, value)
+        self.unit_durations.update(unit.unit_durations)
+        self.add_findings(unit.findings)
+
+    def add_findings(self, findings):
+        if not findings:
+            return
+        if self.sink is not None:
+            self.sink.write_findings(findings)
+        else:
+            self.findings.extend(findings)
+
+    def merge_into(self, target):
+        """Appends these results to another container."""
+        for locale, errors in self.error_messages.items():
+            target.error_messages.setdefault(locale, []).extend(errors)
+        for locale, count in self.error_counts.items():
+            target.error_counts[locale] = target.error_counts.get(locale, 0) + count
+        target.error_summary.update(self.error_summary)
+        for msg_type in ("errors", "warnings"):
+            target.output_cl[msg_type].update(self.output_cl[msg_type])
+        target.general_errors.extend(self.general_errors)
+        target.unit_durations.update(self.unit_durations)
+        target.add_findings(self.findings)
+
+    def to_dict(self):
+        return {
+            "error_messages": self.error_messages,
+            "error_summary": self.error_summary,
+            "output_cl": self.output_cl,
+            "general_errors": self.general_errors,
+            "findings": self.findings,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        results = cls(data["error_messages"].keys())
+        for locale, errors in data["error_messages"].items():
+            results.error_messages[locale].extend(errors)
+        results.error_summary.update(data["error_summary"])
+        for msg_type in ("errors", "warnings"):
+            results.output_cl[msg_type].update(data["output_cl"][msg_type])
+        results.general_errors.extend(data["general_errors"])
+        results.findings.extend(data.get("findings", []))
+
+        return results
+
+
+class Checkpoints:
+    """
+    Stores the results of each completed unit of work (check file, view and
+    locale, TMX locale, compare-locales partition) in a run folder, so that
+    an interrupted run can be resumed. Without a folder, nothing is stored.
+    """
+
+    def __init__(self, run_folder=None, signature=None, resume=False):
+        self.run_folder = Path(run_folder) if run_folder else None
+        if self.run_folder is None:
+            return
+
+        # Only reuse checkpoints created by a run with the same parameters
+        signature_file = self.run_folder / "run.json"
+        if resume:
+            try:
+                with open(signature_file, encoding="utf-8") as f:
+                    if json.load(f) == signature:
+                        return
+            except (OSError, ValueError):
+                pass
+            print("No checkpoints available for this run, starting from scratch.")
+
+        shutil.rmtree(self.run_folder, ignore_errors=True)
+        self.run_folder.mkdir(parents=True)
+        with open(signature_file, "w", encoding="utf-8") as f:
+            json.dump(signature, f)
+
+    def run_unit(self, phase, unit, compute):
+        """
+        Returns the results of a unit of work, calling compute() with an
+        empty ResultsContainer only if it didn't complete in a previous run.
+        """
+        unit_file = None
+        if self.run_folder is not None:
+            unit_name = re.sub(r"[^\w.-]", "_", unit)
+            unit_file = self.run_folder / phase / f"{unit_name}.json"
+            if unit_file.exists():
+                try:
+                    with open(unit_file, encoding="utf-8") as f:
+                        return ResultsContainer.from_dict(json.load(f))
+                except (OSError, ValueError, KeyError):
+                    pass
+
+        results = ResultsContainer([])
+        start_time = time.monotonic()
+        compute(results)
+        results.unit_durations[f"{phase}/{unit}"] = round(
+            time.monotonic() - start_time, 3
+        )
+
+        if unit_file is not None:
+            unit_file.parent.mkdir(exist_ok=True)
+            # Write to a temporary file first, a checkpoint is either
+            # complete or missing
+            temp_file = unit_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(results.to_dict(), f)
+            os.replace(temp_file, unit_file)
+
+        return results
+
+    def clear(self):
+        """Removes checkpoints once the run has completed."""
+        if self.run_folder is not None:
+            shutil.rmtree(self.run_folder, ignore_errors=True)
+
+
+def parse_shard(value):
+    """Parses a shard definition in the form i/N (1 <= i <= N)."""
+    try:
+        index, count = (int(v) for v in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard {value}, expected i/N")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Invalid shard {value}, expected i/N")
+
+    return index, count
+
+
+def partition_locales(locales, count, weights):
+    """
+    Splits locales in count groups with a similar amount of work, assigning
+    the heaviest locales first to the least loaded group. The result only
+    depends on the list of locales and their weights, so every host computes
+    the same partition.
+    """
+    from run_metrics import lpt_schedule
+
+    groups = [set(group) for group, _ in lpt_schedule(locales, weights, count)]
+
+    # Keep the original order within each group
+    return [[loc for loc in locales if loc in group] for group in groups]
+
+
+def merge_summaries(target, summary):
+    """Adds the counts from summary to target (used to combine shards)."""
+    for check, count in summary.items():
+        if isinstance(count, dict):
+            current = target.setdefault(check, {})
+            for key, value in count.items():
+                current[key] = current.get(key, 0) + value
+        else:
+            target[check] = target.get(check, 0) + count
+
+
+def save_findings(root_folder, locales, findings):
+    """
+    Stores findings of a full run (or merged shards) before applying
+    exceptions, to preview the effect of changes to exceptions with
+    what_if.py. Findings are written one at a time, they can be read from a
+    stream.
+    """
+    # Write to a temporary file first, what_if.py might be reading it
+    findings_file = Path(root_folder) / FINDINGS_FILE
+    temp_file = findings_file.with_suffix(".tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.write(f'{{"locales": {json.dumps(locales)}, "findings": [')
+        for i, finding in enumerate(findings):
+            f.write(", " if i else "")
+            f.write(json.dumps(finding))
+        f.write("]}")
+    os.replace(temp_file, findings_file)
+
+
 class APIChecker:
-    def __init__(self, api_url, root_folder, verbose=False):
+    def __init__(
+        self,
+        api_url,
+        root_folder,
+        verbose=False,
+        catalog=None,
+        skipped_types=CORPUS_CHECK_TYPES,
+    ):
         self.api_url = api_url
         self.root_folder = Path(root_folder)
         self.verbose = verbose
+        # Check definitions already loaded, by check file
+        self.catalog = catalog or {}
+        # Types of checks evaluated on TMX caches instead (see check_corpus,
+        # check_plurals)
+        self.skipped_types = skipped_types
         self.url_template = "{}/entity/gecko_strings/?id={}:{}"
 
-    def get_json_data(self, url):
+        from regex_guard import RegexGuard
+
+        # User-defined patterns run with a time budget
+        self.regex_guard = RegexGuard()
+
+    def get_json_data(self, url, results_container):
         """Fetches JSON with 5 retries and ensures socket closure."""
-        for _ in range(5):
+        from urllib.request import urlopen
+
+        for attempt in range(5):
+            results_container.count("requests")
+            if attempt:
+                results_container.count("retries")
             try:
                 with urlopen(url, timeout=10) as response:
-                    return json.load(response), True
+                    content = response.read()
+                results_container.count("bytes_downloaded", len(content))
+                return json.loads(content), True
             except Exception as e:
                 print(f"Error fetchinf remote JSON from {url}: {e}")
                 continue
         return {}, False
 
-    def run(self, json_files, locales, plural_forms, results_container):
+    def run(
+        self, json_files, locales, plural_forms, results_container, checkpoints=None
+    ):
+        checkpoints = checkpoints or Checkpoints()
         for json_file in json_files:
-            total_errors = 0
-            if self.verbose:
-                print(f"CHECK: {json_file}")
+            unit = checkpoints.run_unit(
+                "api",
+                json_file,
+                lambda r: self._run_check_file(json_file, locales, plural_forms, r),
+            )
+            results_container.add_results(unit, "api", json_file)
+
+    def _run_check_file(self, json_file, locales, plural_forms, results_container):
+        """Runs all checks defined in a JSON file."""
+        total_errors = 0
+        if self.verbose:
+            print(f"CHECK: {json_file}")
 
-            # Load check definitions
+        # Load check definitions
+        checks = self.catalog.get(json_file)
+        if checks is None:
             check_path = self.root_folder / "checks" / f"{json_file}.json"
             try:
                 with open(check_path, encoding="utf-8") as f:
                     checks = json.load(f)
             except Exception as e:
                 print(f"Error loading JSON file {json_file}: {e}")
+                return
+
+        for c in checks:
+            if c["type"] in self.skipped_types:
                 continue
 
-            for c in checks:
-                query_url = self.url_template.format(
-                    self.api_url, c["file"], c["entity"]
+            query_url = self.url_template.format(self.api_url, c["file"], c["entity"])
+            json_data, success = self.get_json_data(query_url, results_container)
+
+            if not success:
+                results_container.general_errors.append(
+                    f"Error checking {c['file']}:{c['entity']}"
                 )
-                json_data, success = self.get_json_data(query_url)
+                continue
 
-                if not success:
-                    results_container.general_errors.append(
-                        f"Error checking {c['file']}:{c['entity']}"
-                    )
+            for locale, translation in json_data.items():
+                if locale == "en-US" or locale not in locales:
                     continue
 
-                for locale, translation in json_data.items():
-                    if locale == "en-US" or locale not in locales:
-                        continue
-
-                    # Original Exclusion Logic
-                    if "excluded_locales" in c and locale in c["excluded_locales"]:
-                        continue
-                    if "included_locales" in c and locale not in c["included_locales"]:
-                        continue
+                # Original Exclusion Logic
+                if "excluded_locales" in c and locale in c["excluded_locales"]:
+                    continue
+                if "included_locales" in c and locale not in c["included_locales"]:
+                    continue
 
-                    error_msg = self._perform_checks(
-                        c, translation, locale, plural_forms
-                    )
+                results_container.count("strings_checked")
+                error_msg = self._perform_checks(c, translation, locale, plural_forms)
 
-                    if error_msg:
-                        results_container.error_messages[locale].extend(error_msg)
-                        total_errors += len(error_msg)
+                if error_msg:
+                    results_container.add_errors(locale, error_msg, "api", json_file)
+                    total_errors += len(error_msg)
 
-            if total_errors:
-                results_container.error_summary[json_file] = total_errors
+        if total_errors:
+            results_container.error_summary[json_file] = total_errors
+        results_container.general_errors.extend(
+            f"{msg} ({json_file})" for msg in self.regex_guard.pop_offenders()
+        )
 
     def _perform_checks(self, c, translation, locale, plural_forms):
         error_msg = []
@@ -130,12 +546,12 @@ class APIChecker:
 
         if check_type == "include_regex":
             for t in c["checks"]:
-                if not re.search(t, translation, re.UNICODE):
+                if self.regex_guard.search(t, translation) is False:
                     error_msg.append(f"Missing {t} {file_entity}")
 
         elif check_type == "not_include_regex":
             for t in c["checks"]:
-                if re.search(t, translation, re.UNICODE):
+                if self.regex_guard.search(t, translation):
                     error_msg.append(f"String includes {t} {file_entity}")
 
         elif check_type == "include":
@@ -191,19 +607,46 @@ class APIChecker:
 
 
 class CompareLocalesChecker:
-    def __init__(self, firefoxl10n_path, toml_path, locales, verbose=False):
+    # Number of locales checked in each unit of work
+    partition_size = 10
+
+    def __init__(
+        self, firefoxl10n_path, toml_path, locales, verbose=False, product=None
+    ):
         self.firefoxl10n_path = firefoxl10n_path
         self.toml_path = toml_path
         self.verbose = verbose
-        if locales:
+        # Set when checking several products, each one with its own TOML
+        self.product = product
+        self.summary_key = (
+            f"compare-locales ({product})" if product else "compare-locales"
+        )
+        # Without locales, all folders of the l10n repositories are checked
+        if locales is not None:
             self.locales = tuple(locales)
         else:
-            self.locales = [
-                loc
-                for loc in next(os.walk(self.firefoxl10n_path))[1]
-                if not loc.startswith(".")
-            ]
-            self.locales.sort()
+            self.locales = self.get_l10n_locales(firefoxl10n_path)
+
+    @staticmethod
+    def get_l10n_locales(firefoxl10n_path):
+        """Returns the locales with a folder in the l10n repositories."""
+        return sorted(
+            loc for loc in next(os.walk(firefoxl10n_path))[1] if not loc.startswith(".")
+        )
+
+    @property
+    def phase(self):
+        """Name of the phase for checkpoints and unit costs."""
+        return f"compare-locales-{self.product}" if self.product else "compare-locales"
+
+    def get_partitions(self):
+        """Returns the groups of locales checked in each unit of work."""
+        partitions = OrderedDict()
+        for i in range(0, len(self.locales), self.partition_size):
+            partition = self.locales[i : i + self.partition_size]
+            partitions[f"{partition[0]}-{partition[-1]}"] = partition
+
+        return partitions
 
     def _extract_messages(self, data, cl_output):
         """Recursively traverse results to extract warnings and errors."""
@@ -222,16 +665,37 @@ class CompareLocalesChecker:
             else:
                 self._extract_messages(node_data, cl_output)
 
-    def run(self, results_container):
+    def run(self, results_container, checkpoints=None):
         """Executes compare-locales and populates the results container."""
+        from compare_locales.paths import ConfigNotFound, TOMLParser
+
+        checkpoints = checkpoints or Checkpoints()
         config_env = {"l10n_base": self.firefoxl10n_path}
         try:
             config = TOMLParser().parse(self.toml_path, env=config_env)
-            if self.verbose:
-                print("Running compare-locales checks...")
-            observers = compareProjects([config], self.locales, self.firefoxl10n_path)
         except (ConfigNotFound, OSError) as e:
             sys.exit(f"Error running compare-locales: {e}")
+        if self.verbose:
+            print("Running compare-locales checks...")
+
+        for name, partition in self.get_partitions().items():
+            unit = checkpoints.run_unit(
+                self.phase,
+                name,
+                lambda r: self._run_partition(config, partition, r),
+            )
+            results_container.add_results(
+                unit, "compare-locales", "compare-locales", self.product
+            )
+
+    def _run_partition(self, config, locales, results_container):
+        """Runs compare-locales on a group of locales."""
+        from compare_locales.compare import compareProjects
+
+        try:
+            observers = compareProjects([config], locales, self.firefoxl10n_path)
+        except OSError as e:
+            sys.exit(f"Error running compare-locales: {e}")
 
         data = [observer.toJSON() for observer in observers]
         if not data:
@@ -247,6 +711,10 @@ class CompareLocalesChecker:
         }
 
         for locale, stats in data[0]["summary"].items():
+            results_container.count(
+                "strings_checked",
+                stats.get("changed", 0) + stats.get("unchanged", 0),
+            )
             if stats["errors"] + stats["warnings"] == 0:
                 continue
 
@@ -258,18 +726,65 @@ class CompareLocalesChecker:
             self._extract_messages(cl_data, cl_output)
 
             if stats["errors"] > 0:
-                results_container.output_cl["errors"][locale] = cl_output["errors"]
+                results_container.add_cl_messages("errors", locale, cl_output["errors"])
                 total_errors += stats["errors"]
             if stats["warnings"] > 0:
-                results_container.output_cl["warnings"][locale] = cl_output["warnings"]
+                results_container.add_cl_messages(
+                    "warnings", locale, cl_output["warnings"]
+                )
                 total_warnings += stats["warnings"]
 
-        results_container.error_summary["compare-locales"] = {
+        results_container.error_summary[self.summary_key] = {
             "errors": total_errors,
             "warnings": total_warnings,
         }
 
 
+class AnalysisCache:
+    """
+    Bounded cache of values derived from a text (e.g. HTML tags), shared
+    across locales: identical translations are only analyzed once.
+
+    The cache is kept in memory by each process: with several workers, each
+    one has its own cache, and hits and misses are sent back with results
+    (see TMXChecker.count_stats).
+    """
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self.cache = OrderedDict()
+        self.hits = {}
+        self.misses = {}
+
+    def get(self, kind, text, compute):
+        key = (kind, text)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits[kind] = self.hits.get(kind, 0) + 1
+            return self.cache[key]
+
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+        value = compute(text)
+        self.cache[key] = value
+        if len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
+        return value
+
+    @staticmethod
+    def print_stats(stats):
+        """Prints hits for each kind of value, from counters of results."""
+        kinds = {
+            counter.split(":", 1)[1]
+            for counter in stats
+            if counter.startswith(("cache_hits:", "cache_misses:"))
+        }
+        for kind in sorted(kinds):
+            hits = stats.get(f"cache_hits:{kind}", 0)
+            total = hits + stats.get(f"cache_misses:{kind}", 0)
+            print(f"- {kind}: {hits}/{total} cache hits ({hits / total:.1%})")
+
+
 class TMXChecker:
     def __init__(
         self,
@@ -277,28 +792,60 @@ class TMXChecker:
         root_folder: str,
         excluded_products: tuple,
         verbose: bool = False,
+        source: str = "tmx",
+        l10n_path: str = "",
+        enus_path: str = "",
     ):
         self.tmx_path = Path(tmx_path)
         self.root_folder = Path(root_folder)
         self.excluded_products = excluded_products
         self.verbose = verbose
+        # With source "l10n", FTL strings are read from the .ftl files in the
+        # l10n and en-US repositories instead of the TMX caches
+        self.source = source
+        self.l10n_path = Path(l10n_path)
+        self.enus_path = Path(enus_path)
 
         self.datal10n_pattern = re.compile(
             r'data-l10n-name\s*=\s*"([a-zA-Z\-]*)"', re.UNICODE
         )
+        # Possessive quantifiers, to avoid backtracking on long strings
         self.placeable_pattern = re.compile(
-            r'(?<!\{)\{\s*([\$|-]?[\w.-]+)(?:[\[(]?[\w.\-, :"]+[\])])*\s*\}', re.UNICODE
+            r'(?<!\{)\{\s*([\$|-]?[\w.-]++)(?:[\[(]?[\w.\-, :"]++[\])])*+\s*\}',
+            re.UNICODE,
         )
         self.fluent_function_pattern = re.compile(
             r"(NUMBER|DATETIME)\(([^)]*)\)", re.UNICODE
         )
         self.css_pattern = re.compile(r"[^\d]*", re.UNICODE)
 
+        self.analysis_cache = AnalysisCache()
+        # IDs of translations identical to en-US, not compared with the
+        # reference (counted once per locale, see count_stats)
+        self.identical_strings = set()
+        # Preprocessed reference and exclusions, kept between runs
+        self.ref = None
+        self.exclusions = (None, None)
+
     def load_exclusions(self):
-        """Loads TMX-specific exclusions from JSON."""
+        """Loads TMX-specific exclusions from JSON, if the file changed."""
         exclusions_file = self.root_folder / "exceptions" / "tmx_exceptions.json"
-        with open(exclusions_file, encoding="utf-8") as f:
-            return json.load(f)
+        mtime = exclusions_file.stat().st_mtime_ns
+        if self.exclusions[0] != mtime:
+            with open(exclusions_file, encoding="utf-8") as f:
+                self.exclusions = (mtime, json.load(f))
+
+        return self.exclusions[1]
+
+    def prepare(self):
+        """Loads and preprocesses the en-US reference, only once."""
+        if self.ref is None:
+            reference_data, reference_facts = self.load_data(
+                "en-US", lambda sid: not sid.startswith(self.excluded_products)
+            )
+            self.ref = self.preprocess_reference(reference_data, reference_facts)
+
+        return self.ref
 
     def _ignore_string(
         self, string_id, locale, locale_data, exclusions, exclusion_type
@@ -307,20 +854,26 @@ class TMXChecker:
             return True
         if string_id.startswith(self.excluded_products):
             return True
-        if (
-            "files" in exclusions[exclusion_type]
-            and string_id.split(":")[0] in exclusions[exclusion_type]["files"]
-        ):
+        return self.is_excluded(string_id, locale, exclusions, exclusion_type)
+
+    @staticmethod
+    def is_excluded(string_id, locale, exclusions, exclusion_type):
+        """Checks if a string is excluded from a type of check."""
+        rules = exclusions[exclusion_type]
+        if string_id.split(":")[0] in rules.get("files", []):
             return True
-        if string_id in exclusions[exclusion_type]["strings"]:
+        if string_id in rules["strings"]:
             return True
-        if (
-            locale in exclusions[exclusion_type]["locales"]
-            and string_id in exclusions[exclusion_type]["locales"][locale]
-        ):
+        if string_id in rules.get("locales", {}).get(locale, []):
             return True
         return False
 
+    def _skip_string(self, string_id, locale_data):
+        """Strings missing in the locale, or belonging to excluded products."""
+        return string_id not in locale_data or string_id.startswith(
+            self.excluded_products
+        )
+
     def _extract_function_calls(self, text):
         """Extracts Fluent function calls (NUMBER, DATETIME)."""
         calls = []
@@ -332,8 +885,66 @@ class TMXChecker:
                 calls.append(call)
         return sorted(calls)
 
-    def preprocess_reference(self, reference_data):
+    def _get_function_calls(self, text):
+        return self.analysis_cache.get(
+            "Fluent functions", text, self._extract_function_calls
+        )
+
+    def _get_data_l10n_names(self, text):
+        return self.analysis_cache.get(
+            "data-l10n-name",
+            text,
+            lambda t: sorted(set(self.datal10n_pattern.findall(t))),
+        )
+
+    def _get_css_values(self, text):
+        return self.analysis_cache.get(
+            "CSS",
+            text,
+            lambda t: [
+                m for m in self.css_pattern.findall(t.rstrip(";")) if m not in ["", "."]
+            ],
+        )
+
+    def _get_html_tags(self, text):
+        return self.analysis_cache.get("HTML", text, self._extract_html_tags)
+
+    def _analyze(self, kind, sid, text, facts):
+        """Uses values derived from the Fluent AST if available."""
+        if sid in facts:
+            return facts[sid][kind]
+        if kind == "HTML":
+            return self._get_html_tags(text)
+        if kind == "data-l10n-name":
+            return self._get_data_l10n_names(text)
+        if kind == "Fluent functions":
+            return self._get_function_calls(text)
+        return '{ "' in text
+
+    def _extract_html_tags(self, text):
+        """Extracts HTML tags, ignoring placeables and non-default variants."""
+        from custom_html_parser import MyHTMLParser
+        from fluent.syntax import parse
+        from fluent.syntax.serializer import FluentSerializer
+        from fluent_utils import flattenSelectExpression
+
+        if not hasattr(self, "_html_parser"):
+            self._html_parser = MyHTMLParser()
+            self._flattener = flattenSelectExpression()
+            self._serializer = FluentSerializer()
+
+        if "*[" in text:
+            text = self._serializer.serialize(
+                self._flattener.visit(parse(f"temp_id = {text}"))
+            )
+        self._html_parser.clear()
+        self._html_parser.feed(self.placeable_pattern.sub("", text))
+
+        return self._html_parser.get_tags()
+
+    def preprocess_reference(self, reference_data, facts=None):
         """Processes en-US data once to identify HTML, CSS, and Fluent functions."""
+        facts = facts or {}
         processed = {
             "ftl_ids": [],
             "data_l10n_ids": {},
@@ -341,14 +952,10 @@ class TMXChecker:
             "css_strings": {},
             "html_strings": {},
             "reference_ids": [],
+            # en-US text for strings compared with translations
+            "texts": {},
         }
 
-        from custom_html_parser import MyHTMLParser
-
-        html_parser = MyHTMLParser()
-        flattener = flattenSelectExpression()
-        serializer = FluentSerializer()
-
         for string_id, text in reference_data.items():
             file_id, message_id = string_id.split(":")
 
@@ -363,197 +970,322 @@ class TMXChecker:
                 processed["ftl_ids"].append(string_id)
 
                 # Data-l10n-name check
-                matches = list(set(self.datal10n_pattern.findall(text)))
+                matches = self._analyze("data-l10n-name", string_id, text, facts)
                 if matches:
-                    processed["data_l10n_ids"][string_id] = sorted(matches)
+                    processed["data_l10n_ids"][string_id] = matches
+                    processed["texts"][string_id] = text
 
                 # CSS check
                 if message_id.endswith(".style"):
-                    matches = [
-                        m
-                        for m in self.css_pattern.findall(text.rstrip(";"))
-                        if m not in ["", "."]
-                    ]
-                    processed["css_strings"][string_id] = matches
+                    processed["css_strings"][string_id] = self._get_css_values(text)
+                    processed["texts"][string_id] = text
 
                 # Fluent functions
-                fn_matches = self._extract_function_calls(text)
+                fn_matches = self._analyze("Fluent functions", string_id, text, facts)
                 if fn_matches:
                     processed["fluent_function_ids"][string_id] = fn_matches
+                    processed["texts"][string_id] = text
 
             # HTML Tags check
-            temp_text = text
-            if "*[" in text:
-                temp_text = serializer.serialize(
-                    flattener.visit(parse(f"temp_id = {text}"))
-                )
-
-            cleaned_text = self.placeable_pattern.sub("", temp_text)
-            html_parser.clear()
-            html_parser.feed(cleaned_text)
-            tags = html_parser.get_tags()
+            tags = self._analyze("HTML", string_id, text, facts)
             if tags:
                 processed["html_strings"][string_id] = tags
+                processed["texts"][string_id] = text
 
         return processed
 
-    def run(self, locales, results_container):
-        """Main execution loop for TMX checks."""
-        exclusions = self.load_exclusions()
-        ref_path = self.tmx_path / "en-US" / "cache_en-US_gecko_strings.json"
+    def _same_as_reference(self, sid, text, ref):
+        """Translations identical to en-US can't differ in tags, functions, etc."""
+        if text == ref["texts"][sid]:
+            self.identical_strings.add(sid)
+            return True
+        return False
 
-        with open(ref_path, encoding="utf-8") as f:
-            reference_data = json.load(f)
+    def _has_data(self, locale):
+        from tmx_cache import cache_path
 
-        ref = self.preprocess_reference(reference_data)
-        tmx_errors = 0
+        if self.source == "l10n":
+            return (self.l10n_path / locale).is_dir()
+        return cache_path(self.tmx_path, locale).exists()
 
-        flattener = flattenSelectExpression()
-        serializer = FluentSerializer()
+    def load_data(self, locale, keep):
+        """
+        Returns the strings accepted by keep (a function) for a locale, and
+        the values derived from the AST for strings read from .ftl files.
+        """
+        from tmx_cache import cache_path, load_cache
 
-        for locale in locales:
-            locale_file = self.tmx_path / locale / f"cache_{locale}_gecko_strings.json"
-            if not locale_file.exists():
-                continue
+        cache_file = cache_path(self.tmx_path, locale)
+        if self.source == "tmx":
+            return load_cache(cache_file, keep), {}
 
-            with open(locale_file, encoding="utf-8") as f:
-                locale_data = json.load(f)
+        from fluent_source import FluentSource, is_ftl_id
 
-            locale_errors = []
+        # Strings from other file formats are still read from the TMX cache
+        data = {}
+        if cache_file.exists():
+            data = load_cache(cache_file, lambda sid: keep(sid) and not is_ftl_id(sid))
+        base_path = self.enus_path if locale == "en-US" else self.l10n_path / locale
+        texts, facts = FluentSource(self.datal10n_pattern).load_tree(base_path, keep)
+        data.update(texts)
 
-            # Check for mandatory strings
-            for sid in exclusions["mandatory"]["strings"]:
-                if self._ignore_string(
-                    sid, locale, locale_data, exclusions, "mandatory"
-                ):
-                    continue
+        return data, facts
 
-                if sid not in locale_data:
-                    locale_errors.append(
-                        f"Missing translation for mandatory key ({sid})"
+    def run(self, locales, results_container, checkpoints=None, workers=1, costs=None):
+        """
+        Main execution loop for TMX checks. With several workers, locales are
+        checked in separate processes, longest first according to costs.
+        """
+        checkpoints = checkpoints or Checkpoints()
+        exclusions = self.load_exclusions()
+        ref = self.count_stats(results_container, self.prepare)
+
+        # Only strings used by the checks are stored when loading locale data
+        needed_ids = set(ref["reference_ids"])
+        needed_ids.update(exclusions["mandatory"]["strings"])
+
+        locales = [locale for locale in locales if self._has_data(locale)]
+        if workers > 1 and len(locales) > 1:
+            costs = costs or {}
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_tmx_worker,
+                initargs=(self, ref, exclusions, needed_ids, checkpoints),
+            ) as executor:
+                # Workers pick up units in submission order
+                futures = {
+                    locale: executor.submit(_run_tmx_unit, locale)
+                    for locale in sorted(locales, key=lambda loc: -costs.get(loc, 1))
+                }
+                for locale in locales:
+                    results_container.add_results(
+                        futures[locale].result(), "tmx", "TMX checks"
                     )
+        else:
+            for locale in locales:
+                unit = self.run_unit(locale, ref, exclusions, needed_ids, checkpoints)
+                results_container.add_results(unit, "tmx", "TMX checks")
 
-            # General checks (links and pilcrows)
-            for sid in ref["reference_ids"]:
-                if self._ignore_string(sid, locale, locale_data, exclusions, "ignore"):
-                    continue
+        results_container.error_summary.setdefault("TMX checks", 0)
 
-                translation = locale_data[sid]
-                if not self._ignore_string(
-                    sid, locale, locale_data, exclusions, "http"
-                ):
-                    if re.search(r"http(s)*:\/\/", translation, re.UNICODE):
-                        locale_errors.append(f"Link in string ({sid})")
+        if self.verbose:
+            # Counters of all processes, sent back with results
+            stats = results_container.stats
+            print(
+                "TMX checks: skipped comparison for "
+                f"{stats.get('identical_strings', 0)} strings identical to en-US"
+            )
+            AnalysisCache.print_stats(stats)
 
-                if "¶" in translation:
-                    locale_errors.append(f"Pilcrow character in string ({sid})")
+    def count_stats(self, results_container, fn):
+        """
+        Calls fn, and adds to results_container the strings identical to
+        en-US and the cache hits and misses of this process during the call.
+        """
+        self.identical_strings = set()
+        hits = dict(self.analysis_cache.hits)
+        misses = dict(self.analysis_cache.misses)
+        result = fn()
+
+        results_container.count("identical_strings", len(self.identical_strings))
+        for kind, value in self.analysis_cache.hits.items():
+            results_container.count(f"cache_hits:{kind}", value - hits.get(kind, 0))
+        for kind, value in self.analysis_cache.misses.items():
+            results_container.count(f"cache_misses:{kind}", value - misses.get(kind, 0))
+
+        return result
+
+    def run_unit(self, locale, ref, exclusions, needed_ids, checkpoints):
+        return checkpoints.run_unit(
+            "tmx",
+            locale,
+            lambda r: self.count_stats(
+                r,
+                lambda: self._check_locale(
+                    locale,
+                    *self.load_data(locale, needed_ids.__contains__),
+                    ref,
+                    exclusions,
+                    r,
+                ),
+            ),
+        )
 
-            # HTML mismatch check
-            from custom_html_parser import MyHTMLParser
+    def _check_locale(
+        self, locale, locale_data, facts, ref, exclusions, results_container
+    ):
+        """
+        Runs all TMX checks on a locale. Each finding lists the types of
+        exclusions that can hide it, and exclusions are applied at the end.
+        """
+        results_container.count("strings_checked", len(locale_data))
+        findings = []
 
-            lp = MyHTMLParser()
-            for sid, ref_tags in ref["html_strings"].items():
-                if self._ignore_string(sid, locale, locale_data, exclusions, "HTML"):
-                    continue
+        def add(message, sid, *exclusion_types):
+            findings.append((message, sid, exclusion_types))
 
-                trans = locale_data[sid]
-                if "*[" in trans:
-                    trans = serializer.serialize(
-                        flattener.visit(parse(f"temp_id = {trans}"))
-                    )
+        # Check for mandatory strings
+        for sid in exclusions["mandatory"]["strings"]:
+            if self._ignore_string(sid, locale, locale_data, exclusions, "mandatory"):
+                continue
 
-                lp.clear()
-                lp.feed(self.placeable_pattern.sub("", trans))
-                tags = lp.get_tags()
+            if sid not in locale_data:
+                add(f"Missing translation for mandatory key ({sid})", sid)
 
-                if tags != ref_tags and sorted(tags) != sorted(ref_tags):
-                    locale_errors.append(f"Mismatched HTML elements in string ({sid})")
+        # General checks (links and pilcrows)
+        for sid in ref["reference_ids"]:
+            if self._skip_string(sid, locale_data):
+                continue
 
-            # FTL specific checks (literals, XML entities, printf, string ID)
-            for sid in ref["ftl_ids"]:
-                if self._ignore_string(sid, locale, locale_data, exclusions, "ignore"):
-                    continue
+            translation = locale_data[sid]
+            if re.search(r"http(s)*:\/\/", translation, re.UNICODE):
+                add(f"Link in string ({sid})", sid, "ignore", "http")
 
-                trans = locale_data[sid]
-                if '{ "' in trans and not self._ignore_string(
-                    sid, locale, locale_data, exclusions, "ftl_literals"
-                ):
-                    locale_errors.append(f"Fluent literal in string ({sid})")
+            if "¶" in translation:
+                add(f"Pilcrow character in string ({sid})", sid, "ignore")
 
-                if (
-                    re.search(r"&.*;", trans, re.UNICODE)
-                    and sid not in exclusions["xml"]["strings"]
-                ):
-                    locale_errors.append(f"XML entity in Fluent string ({sid})")
-
-                if sid not in exclusions["printf"]["strings"]:
-                    if re.search(
-                        r"(%(?:[0-9]+\$){0,1}(?:[0-9].){0,1}([sS]))", trans, re.UNICODE
-                    ):
-                        locale_errors.append(
-                            f"printf variables in Fluent string ({sid})"
-                        )
+        # HTML mismatch check
+        for sid, ref_tags in ref["html_strings"].items():
+            if self._skip_string(sid, locale_data):
+                continue
+            if self._same_as_reference(sid, locale_data[sid], ref):
+                continue
 
-                msg_id = sid.split(":")[1]
-                if re.search(re.escape(msg_id) + r"\s*=", trans, re.UNICODE):
-                    locale_errors.append(
-                        f"Message ID is repeated in the Fluent string ({sid})"
-                    )
+            tags = self._analyze("HTML", sid, locale_data[sid], facts)
+            if tags != ref_tags and sorted(tags) != sorted(ref_tags):
+                add(f"Mismatched HTML elements in string ({sid})", sid, "HTML")
 
-            # data-l10n-name mismatch
-            for sid, groups in ref["data_l10n_ids"].items():
-                if sid not in locale_data:
-                    continue
-                m = sorted(list(set(self.datal10n_pattern.findall(locale_data[sid]))))
-                if not m:
-                    locale_errors.append(
-                        f"data-l10n-name missing in Fluent string ({sid})"
-                    )
-                elif m != groups:
-                    locale_errors.append(
-                        f"data-l10n-name mismatch in Fluent string ({sid})"
-                    )
+        # FTL specific checks (literals, XML entities, printf, string ID)
+        for sid in ref["ftl_ids"]:
+            if self._skip_string(sid, locale_data):
+                continue
 
-            # Fluent function mismatch
-            for sid, source_matches in ref["fluent_function_ids"].items():
-                if self._ignore_string(
-                    sid, locale, locale_data, exclusions, "fluent_functions"
-                ):
-                    continue
-                m = self._extract_function_calls(locale_data[sid])
-                if not m:
-                    locale_errors.append(
-                        f"Fluent function missing in Fluent string ({sid})"
-                    )
-                elif m != source_matches:
-                    locale_errors.append(
-                        f"Fluent function mismatch in Fluent string ({sid})"
-                    )
+            trans = locale_data[sid]
+            if self._analyze("literal", sid, trans, facts):
+                add(f"Fluent literal in string ({sid})", sid, "ignore", "ftl_literals")
 
-            # CSS mismatch
-            for sid, source_css in ref["css_strings"].items():
-                if sid not in locale_data:
-                    continue
-                m = [
-                    c
-                    for c in self.css_pattern.findall(locale_data[sid].rstrip(";"))
-                    if c not in ["", "."]
-                ]
-                if m != source_css:
-                    locale_errors.append(f"CSS mismatch in Fluent string ({sid})")
+            if re.search(r"&.*;", trans, re.UNICODE):
+                add(f"XML entity in Fluent string ({sid})", sid, "ignore", "xml")
+
+            if re.search(
+                r"(%(?:[0-9]+\$){0,1}(?:[0-9].){0,1}([sS]))", trans, re.UNICODE
+            ):
+                add(
+                    f"printf variables in Fluent string ({sid})",
+                    sid,
+                    "ignore",
+                    "printf",
+                )
+
+            msg_id = sid.split(":")[1]
+            if re.search(re.escape(msg_id) + r"\s*=", trans, re.UNICODE):
+                add(
+                    f"Message ID is repeated in the Fluent string ({sid})",
+                    sid,
+                    "ignore",
+                )
+
+        # data-l10n-name mismatch
+        for sid, groups in ref["data_l10n_ids"].items():
+            if sid not in locale_data:
+                continue
+            if self._same_as_reference(sid, locale_data[sid], ref):
+                continue
+            m = self._analyze("data-l10n-name", sid, locale_data[sid], facts)
+            if not m:
+                add(f"data-l10n-name missing in Fluent string ({sid})", sid)
+            elif m != groups:
+                add(f"data-l10n-name mismatch in Fluent string ({sid})", sid)
+
+        # Fluent function mismatch
+        for sid, source_matches in ref["fluent_function_ids"].items():
+            if self._skip_string(sid, locale_data):
+                continue
+            if self._same_as_reference(sid, locale_data[sid], ref):
+                continue
+            m = self._analyze("Fluent functions", sid, locale_data[sid], facts)
+            if not m:
+                add(
+                    f"Fluent function missing in Fluent string ({sid})",
+                    sid,
+                    "fluent_functions",
+                )
+            elif m != source_matches:
+                add(
+                    f"Fluent function mismatch in Fluent string ({sid})",
+                    sid,
+                    "fluent_functions",
+                )
+
+        # CSS mismatch
+        for sid, source_css in ref["css_strings"].items():
+            if sid not in locale_data:
+                continue
+            if self._same_as_reference(sid, locale_data[sid], ref):
+                continue
+            if self._get_css_values(locale_data[sid]) != source_css:
+                add(f"CSS mismatch in Fluent string ({sid})", sid)
+
+        # Apply exclusions, keeping all findings to re-evaluate them when
+        # exclusions change
+        locale_errors = []
+        for message, sid, exclusion_types in findings:
+            reported = not any(
+                self.is_excluded(sid, locale, exclusions, exclusion_type)
+                for exclusion_type in exclusion_types
+            )
+            if reported:
+                locale_errors.append(message)
+            results_container.findings.append(
+                {
+                    "phase": "tmx",
+                    "locale": locale,
+                    "check": "TMX checks",
+                    "message": message,
+                    "string_id": sid,
+                    "exclusions": list(exclusion_types),
+                    "reported": reported,
+                }
+            )
+
+        if locale_errors:
+            results_container.add_errors(locale, locale_errors, "tmx", "TMX checks")
+        results_container.error_summary["TMX checks"] = len(locale_errors)
+
+
+# State of TMX worker processes, set once per process to avoid sending the
+# reference data with each locale
+_tmx_worker = {}
 
-            if locale_errors:
-                results_container.error_messages[locale].extend(locale_errors)
-                tmx_errors += len(locale_errors)
 
-        results_container.error_summary["TMX checks"] = tmx_errors
+def _init_tmx_worker(checker, ref, exclusions, needed_ids, checkpoints):
+    _tmx_worker.update(
+        checker=checker,
+        ref=ref,
+        exclusions=exclusions,
+        needed_ids=needed_ids,
+        checkpoints=checkpoints,
+    )
+
+
+def _run_tmx_unit(locale):
+    checker = _tmx_worker["checker"]
+    return checker.run_unit(
+        locale,
+        _tmx_worker["ref"],
+        _tmx_worker["exclusions"],
+        _tmx_worker["needed_ids"],
+        _tmx_worker["checkpoints"],
+    )
 
 
 class ResultsArchiver:
-    def __init__(self, root_folder: Path, output_path: str):
+    def __init__(
+        self, root_folder: Path, output_path: str, pickle_name="previous_errors.dump"
+    ):
         self.root_folder = root_folder
         self.output_path = Path(output_path) if output_path else None
-        self.pickle_file = self.root_folder / "previous_errors.dump"
+        self.pickle_file = self.root_folder / pickle_name
 
     def _diff(self, a, b):
         b_set = set(b)
@@ -583,21 +1315,11 @@ class ResultsArchiver:
 
     def archive(self, current_error_messages, output_cl, error_summary):
         """Orchestrates the comparison and storage logic."""
-        # Load previous errors
-        previous_errors = {"errors": [], "compare-locales": [], "summary": {}}
-        if self.pickle_file.exists():
-            try:
-                with open(self.pickle_file, "rb") as f:
-                    previous_errors = pickle.load(f)
-            except Exception as e:
-                print(f"Error loading pickle: {e}")
-
         # Flatten current errors for comparison
         current_errors = []
         for locale, errors in current_error_messages.items():
             for e in errors:
                 current_errors.append(f"{locale} - {e}")
-        current_errors.sort()
 
         flattened_cl = []
         for locale, warnings in output_cl["warnings"].items():
@@ -606,8 +1328,38 @@ class ResultsArchiver:
         for locale, errors in output_cl["errors"].items():
             for e in errors:
                 flattened_cl.append(f"{locale} (compare-locales error): {e}")
+
+        self._archive_flattened(current_errors, flattened_cl, error_summary)
+
+    def archive_records(self, records, error_summary):
+        """Same as archive(), with errors read from a ResultsSink stream."""
+        cl_types = {"errors": "error", "warnings": "warning"}
+        current_errors = []
+        flattened_cl = []
+        for r in records:
+            if r["phase"] == "compare-locales":
+                flattened_cl.append(
+                    f"{r['locale']} (compare-locales {cl_types[r['check']]}): "
+                    f"{r['message']}"
+                )
+            else:
+                current_errors.append(f"{r['locale']} - {r['message']}")
+
+        self._archive_flattened(current_errors, flattened_cl, error_summary)
+
+    def _archive_flattened(self, current_errors, flattened_cl, error_summary):
+        current_errors.sort()
         flattened_cl.sort()
 
+        # Load previous errors
+        previous_errors = {"errors": [], "compare-locales": [], "summary": {}}
+        if self.pickle_file.exists():
+            try:
+                with open(self.pickle_file, "rb") as f:
+                    previous_errors = pickle.load(f)
+            except Exception as e:
+                print(f"Error loading pickle: {e}")
+
         # Prepare output structure
         output = {"new": [], "fixed": [], "message": []}
 
@@ -675,57 +1427,513 @@ class ResultsArchiver:
             json.dump(current_data, f, sort_keys=True, indent=2)
 
 
-class flattenSelectExpression(visitor.Transformer):
-    def visit_SelectExpression(self, node):
-        default_variant = None
-        for variant in node.variants:
-            if variant.default:
-                default_variant = variant
-                break
-        if default_variant:
-            node.variants = [default_variant]
+class CheckProvider:
+    """
+    A phase of checks, registered in CHECK_PROVIDERS.
 
-        return node
+    Providers must only import their heavy dependencies in run(), so that
+    runs not selecting them don't pay for loading them.
+    """
 
+    name = ""
+    description = ""
+    # Only run when all checks are requested (no single check on the CLI)
+    full_run_only = True
+    # "io" phases run in a thread, "cpu" phases in a separate process
+    kind = "io"
 
-class QualityCheck:
-    excluded_products = (
-        "calendar",
-        "chat",
-        "editor",
-        "extensions",
-        "mail",
-        "other-licenses",
-        "suite",
-    )
+    def is_available(self, qc) -> bool:
+        """Returns True if the data needed by this phase is configured."""
+        return True
 
-    def __init__(
-        self,
-        root_folder,
-        tmx_path,
+    def get_kind(self, qc) -> str:
+        """Returns the kind of phase for this run (see kind)."""
+        return self.kind
+
+    def get_units(self, qc):
+        """
+        Returns the units of work of this phase as (phase, unit, size), phase
+        being the name used for checkpoints. The size (e.g. of the TMX cache)
+        is optional, and used to estimate units never run before.
+        """
+        return []
+
+    def get_workers(self, qc) -> int:
+        """Returns the number of units of work run at the same time."""
+        return 1
+
+    def run(self, qc, results):
+        raise NotImplementedError
+
+    def execute(self, qc):
+        """Runs the phase and returns its results."""
+        results = ResultsContainer(qc.locales, qc.results.sink)
+        start_time = time.monotonic()
+        self.run(qc, results)
+        results.stats["duration"] = time.monotonic() - start_time
+
+        return results
+
+
+CHECK_PROVIDERS: OrderedDict[str, CheckProvider] = OrderedDict()
+
+
+def register_provider(cls):
+    """Registers a provider. Phases run in order of registration."""
+    CHECK_PROVIDERS[cls.name] = cls()
+    return cls
+
+
+@register_provider
+class APIProvider(CheckProvider):
+    name = "api"
+    description = "checks defined in checks/*.json, via Transvision API"
+    full_run_only = False
+
+    def get_units(self, qc):
+        return [(self.name, f, None) for f in qc.get_active_check_files()]
+
+    def run(self, qc, results):
+        qc.check_API(results)
+
+
+@register_provider
+class ViewsProvider(CheckProvider):
+    name = "views"
+    description = "Transvision views (variables, shortcuts, empty strings)"
+    views = ("variables", "shortcuts", "empty")
+
+    def is_available(self, qc):
+        if qc.local_views:
+            return qc.tmx_path != ""
+        return True
+
+    def get_kind(self, qc):
+        # Views computed on TMX caches are CPU-bound
+        return "cpu" if qc.local_views else self.kind
+
+    def get_units(self, qc):
+        weights = qc.getLocaleWeights()
+        return [
+            (self.name, f"{view}-{loc}", weights.get(loc))
+            for view in self.views
+            for loc in qc.locales
+        ]
+
+    def get_workers(self, qc):
+        return 1 if qc.local_views else qc.workers
+
+    def run(self, qc, results):
+        if qc.local_views:
+            qc.check_local_views(self.views, results)
+            return
+        for view in self.views:
+            qc.check_view(view, results)
+
+
+@register_provider
+class TMXProvider(CheckProvider):
+    name = "tmx"
+    description = "checks on local TMX caches, mostly for FTL files"
+    kind = "cpu"
+
+    def is_available(self, qc):
+        if qc.source == "l10n":
+            return qc.firefoxl10n_path != ""
+        return qc.tmx_path != ""
+
+    def get_units(self, qc):
+        weights = qc.getLocaleWeights()
+        return [(self.name, loc, weights.get(loc)) for loc in qc.locales]
+
+    def get_workers(self, qc):
+        return qc.workers
+
+    def run(self, qc, results):
+        qc.check_TMX(results)
+
+
+@register_provider
+class OutliersProvider(CheckProvider):
+    name = "outliers"
+    description = "translations different from most locales, on local TMX caches"
+    kind = "cpu"
+
+    def is_available(self, qc):
+        return qc.outliers and qc.tmx_path != ""
+
+    def get_units(self, qc):
+        # Locales are compared with each other, in a single unit of work
+        return [(self.name, "all", None)]
+
+    def get_workers(self, qc):
+        return qc.workers
+
+    def run(self, qc, results):
+        qc.check_outliers(results)
+
+
+@register_provider
+class PluralsProvider(CheckProvider):
+    name = "plurals"
+    description = "plural forms of all plural .properties strings, on TMX caches"
+    kind = "cpu"
+
+    def is_available(self, qc):
+        return qc.local_plurals and qc.tmx_path != ""
+
+    def get_units(self, qc):
+        weights = qc.getLocaleWeights()
+        return [(self.name, loc, weights.get(loc)) for loc in qc.locales]
+
+    def run(self, qc, results):
+        qc.check_plurals(results)
+
+
+@register_provider
+class CorpusProvider(CheckProvider):
+    name = "corpus"
+    description = "corpus-wide rules from checks/*.json, on local TMX caches"
+    full_run_only = False
+    kind = "cpu"
+
+    def is_available(self, qc):
+        return qc.tmx_path != ""
+
+    def get_units(self, qc):
+        weights = qc.getLocaleWeights()
+        return [
+            (self.name, f"{json_file}-{loc}", weights.get(loc))
+            for json_file in qc.get_corpus_rules()
+            for loc in qc.locales
+        ]
+
+    def run(self, qc, results):
+        qc.check_corpus(results)
+
+
+@register_provider
+class CompareLocalesProvider(CheckProvider):
+    name = "compare-locales"
+    description = "compare-locales checks on the l10n repository"
+    kind = "cpu"
+
+    def is_available(self, qc):
+        return qc.firefoxl10n_path != ""
+
+    def get_units(self, qc):
+        return [
+            (checker.phase, partition, None)
+            for checker in qc.get_repo_checkers()
+            for partition in checker.get_partitions()
+        ]
+
+    def run(self, qc, results):
+        qc.check_repos(results)
+
+
+def select_providers(cli_options, requested_check):
+    """Returns the list of providers to run, based on command line options."""
+    if cli_options.get("phases"):
+        names = cli_options["phases"]
+    elif cli_options["tmx"]:
+        names = ["tmx"]
+    else:
+        names = list(CHECK_PROVIDERS)
+        if cli_options["ignore_comparelocales"]:
+            names.remove("compare-locales")
+
+    providers = [p for n, p in CHECK_PROVIDERS.items() if n in names]
+    if requested_check != "all":
+        providers = [p for p in providers if not p.full_run_only]
+
+    return providers
+
+
+class PhaseScheduler:
+    """
+    Runs independent phases concurrently: I/O-bound phases on threads,
+    CPU-bound phases in separate processes.
+
+    Results are merged in the order the providers are registered, so the
+    output doesn't depend on which phase completes first.
+    """
+
+    def __init__(self, providers, sequential=False):
+        self.providers = providers
+        self.sequential = sequential
+
+    def _complete(self, qc, provider, results):
+        """Records metrics for a completed phase and merges its results."""
+        qc.metrics.add_phase(
+            provider.name, results.stats.pop("duration"), results.stats
+        )
+        results.merge_into(qc.results)
+
+    def run(self, qc):
+        if self.sequential or len(self.providers) < 2:
+            for provider in self.providers:
+                if qc.verbose:
+                    print(f"PHASE: {provider.name}")
+                self._complete(qc, provider, provider.execute(qc))
+            return
+
+        cpu_providers = [p for p in self.providers if p.get_kind(qc) == "cpu"]
+        io_providers = [p for p in self.providers if p.get_kind(qc) != "cpu"]
+        futures = {}
+        processes = threads = None
+        try:
+            # Start processes before threads, forking a process with running
+            # threads is not safe
+            if cpu_providers:
+                processes = ProcessPoolExecutor(max_workers=len(cpu_providers))
+                for provider in cpu_providers:
+                    futures[provider.name] = processes.submit(provider.execute, qc)
+            if io_providers:
+                threads = ThreadPoolExecutor(max_workers=len(io_providers))
+                for provider in io_providers:
+                    futures[provider.name] = threads.submit(provider.execute, qc)
+            if qc.verbose:
+                print(f"PHASES (concurrent): {', '.join(futures)}")
+
+            for provider in self.providers:
+                self._complete(qc, provider, futures[provider.name].result())
+        finally:
+            for executor in (threads, processes):
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+
+
+class QualityCheck:
+    excluded_products = (
+        "calendar",
+        "chat",
+        "editor",
+        "extensions",
+        "mail",
+        "other-licenses",
+        "suite",
+    )
+
+    def __init__(
+        self,
+        root_folder,
+        tmx_path,
+        firefoxl10n_path,
+        toml_path,
+        requested_check,
+        cli_options,
+        output_path,
+        enus_path="",
+        products=None,
+    ):
+        """Initialize object and run the checks"""
+        self._configure(
+            root_folder,
+            tmx_path,
+            firefoxl10n_path,
+            toml_path,
+            requested_check,
+            cli_options,
+            output_path,
+            enus_path,
+            products,
+        )
+
+        from run_metrics import RunMetrics
+
+        self.metrics = RunMetrics()
+
+        start_datetime = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        print(f"\n--------\nRun: {start_datetime}\n")
+
+        # Results are available while getting locales (e.g. to count requests)
+        self.results = ResultsContainer([])
+        self.error_messages = self.results.error_messages
+        self.error_summary = self.results.error_summary
+        self.output_cl = self.results.output_cl
+        self.general_errors = self.results.general_errors
+
+        # Get the list of supported locales
+        if cli_options["locale"] is None:
+            self.getLocales()
+        else:
+            self.locales = [cli_options["locale"]]
+
+        # Only keep the locales assigned to this shard
+        self.all_locales = list(self.locales)
+        if self.shard:
+            index, count = self.shard
+            self.locales = partition_locales(
+                self.all_locales, count, self.getLocaleWeights()
+            )[index - 1]
+            if self.verbose:
+                print(f"Shard {index}/{count}: {', '.join(self.locales)}")
+
+        # Stream errors to a JSON Lines file while checks are running, once
+        # the kind of run is known
+        sink = None
+        if not cli_options.get("plan") and (
+            cli_options.get("stream") or len(self.products) > 1
+        ):
+            # Each kind of run has its own stream, shards keep names expected
+            # by merge_shards.py
+            if self.shard:
+                stream_name = "results_{}_of_{}.jsonl".format(*self.shard)
+            else:
+                stream_name = self.get_state_name("results.jsonl")
+            sink = ResultsSink(Path(output_path or root_folder) / stream_name)
+        self.results.sink = sink
+
+        # Store the number of plural forms for each locale, only loaded if
+        # API checks are requested
+        self.plural_forms = {}
+
+        # Initialize other error messages
+        for locale in self.locales:
+            self.error_messages[locale] = []
+
+        providers = [
+            p
+            for p in select_providers(cli_options, requested_check)
+            if p.is_available(self)
+        ]
+        self.phases = [p.name for p in providers]
+
+        if cli_options.get("plan"):
+            self.print_plan(providers, cli_options.get("sequential", False))
+            return
+
+        # Store completed units of work, to be able to resume the run if it
+        # gets interrupted
+        self.checkpoints = Checkpoints(
+            run_folder=Path(root_folder) / ".checkpoints" / self.get_run_name(),
+            signature={
+                "check": requested_check,
+                "locales": self.locales,
+                "phases": [p.name for p in providers],
+                "source": self.source,
+                "local_views": self.local_views,
+                "local_plurals": self.local_plurals,
+                "outliers": self.outliers,
+                "products": [p["name"] for p in self.products],
+            },
+            resume=cli_options.get("resume", False),
+        )
+
+        # Run the selected phases (Transvision API and views, local TMX,
+        # compare-locales)
+        PhaseScheduler(providers, cli_options.get("sequential", False)).run(self)
+        if sink is not None:
+            sink.close()
+
+        # Print errors
+        if self.verbose:
+            self.printErrors()
+
+        # Compare with previous run, or store partial results to be merged
+        # with the other shards
+        if requested_check == "all":
+            if self.shard:
+                self.save_shard_results()
+            elif len(self.products) > 1:
+                self.compare_products()
+            else:
+                self.compare_previous_run()
+            # Only findings of full runs are used by what_if.py
+            if self.get_run_name() == "full":
+                save_findings(self.root_folder, self.locales, self.get_findings())
+        self.checkpoints.clear()
+
+        self.metrics.finish(
+            self.get_run_name(), sum(self.results.error_counts.values())
+        )
+        self.metrics.save(Path(self.output_path or self.root_folder))
+        self.unit_costs.update(self.results.unit_durations)
+        self.unit_costs.save()
+
+    def _configure(
+        self,
+        root_folder,
+        tmx_path,
         firefoxl10n_path,
         toml_path,
         requested_check,
         cli_options,
         output_path,
+        enus_path,
+        products,
     ):
-        """Initialize object"""
+        """Stores paths and options, without loading any data."""
         self.root_folder = root_folder
         self.tmx_path = tmx_path
         self.firefoxl10n_path = firefoxl10n_path
         self.toml_path = toml_path
+        # en-US repository, by default the one containing the TOML file
+        self.enus_path = enus_path or str(Path(toml_path).parents[1])
+        self.source = cli_options.get("source", "tmx")
+        self.local_views = cli_options.get("local_views", False)
+        # Check plural forms of all plural strings on TMX caches, instead of
+        # the strings in checks/*.json via Transvision API
+        self.local_plurals = cli_options.get("local_plurals", False)
+        # Compare translations across locales to find outliers (slow, since
+        # all locales are loaded)
+        self.outliers = cli_options.get("outliers", False)
+        # Number of processes for TMX checks (threads for Transvision views)
+        self.workers = cli_options.get("workers", 1)
         self.requested_check = requested_check
+        # Phases selected for this run, and requested with --phase
+        self.phases = []
+        self.requested_phases = cli_options.get("phases") or []
         self.verbose = cli_options["verbose"]
         self.output_path = output_path
         self.single_locale = cli_options["locale"] is not None
+        self.shard = cli_options.get("shard")
 
         self.transvision_url = "https://transvision.flod.org"
         self.api_url = f"{self.transvision_url}/api/v1"
 
-        self.general_errors = []
+        from run_metrics import UnitCosts
 
-        start_datetime = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        print(f"\n--------\nRun: {start_datetime}\n")
+        # Durations of units of work in previous runs
+        self.unit_costs = UnitCosts(
+            Path(output_path or root_folder) / "unit_costs.json"
+        )
+
+        # Data kept between runs in the same process (see QualityCheckSession)
+        self._catalog = None
+        self._view_exceptions = (None, {})
+        self._tmx_checker = None
+        self._local_views = None
+        self._trigram_index = None
+        self._plural_index = None
+        self._outlier_detector = (None, None)
+
+        # Products (e.g. Thunderbird) checked in the same run, in addition to
+        # Firefox. Data is loaded and checked once for all products, with the
+        # strings that none of them excludes, then results are split.
+        self.products = [
+            {
+                "name": "firefox",
+                "toml_path": toml_path,
+                "excluded_products": self.excluded_products,
+                "output_path": output_path,
+                "l10n_path": firefoxl10n_path,
+            }
+        ] + [
+            dict(
+                p,
+                output_path=p["output_path"] or self.get_product_output(p),
+                # Products can have their own l10n repositories
+                l10n_path=p.get("l10n_path") or firefoxl10n_path,
+            )
+            for p in products or []
+        ]
+        self.excluded_products = tuple(
+            prefix
+            for prefix in self.products[0]["excluded_products"]
+            if all(prefix in p["excluded_products"] for p in self.products)
+        )
 
         # Create a list of available checks in JSON format
         self.json_files = []
@@ -734,86 +1942,220 @@ class QualityCheck:
             self.json_files.append(os.path.splitext(check)[0])
         self.json_files.sort()
 
-        # Get the list of supported locales
-        if cli_options["locale"] is None:
-            self.getLocales()
-        else:
-            self.locales = [cli_options["locale"]]
+    def print_plan(self, providers, sequential):
+        """
+        Prints the predicted schedule of units of work for each phase, based
+        on durations in previous runs, and the predicted makespan.
+        """
+        from run_metrics import lpt_schedule
+
+        print("Predicted schedule (longest units first):")
+        makespans = []
+        for provider in providers:
+            provider_units = provider.get_units(self)
+            costs = {}
+            for phase in {p for p, _, _ in provider_units}:
+                estimates = self.unit_costs.estimate(
+                    phase,
+                    [u for p, u, _ in provider_units if p == phase],
+                    {u: s for p, u, s in provider_units if p == phase and s},
+                )
+                costs.update({f"{phase}/{u}": c for u, c in estimates.items()})
+            units = [f"{p}/{u}" for p, u, _ in provider_units]
+            workers = provider.get_workers(self)
+            schedule = lpt_schedule(units, costs, workers)
+            makespan = max(load for _, load in schedule) if units else 0
+            makespans.append(makespan)
+            print(
+                f"\n{provider.name}: {len(units)} units, {workers} worker(s), "
+                f"{makespan:.1f} s"
+            )
+            for i, (assigned, load) in enumerate(schedule, 1):
+                if not assigned:
+                    continue
+                print(
+                    f"- worker {i} ({load:.1f} s): "
+                    + ", ".join(f"{u} ({costs[u]:.1f} s)" for u in assigned)
+                )
 
-        # Store the number of plural forms for each locale
-        self.plural_forms = {}
-        self.getPluralForms()
+        total = sum(makespans) if sequential else max(makespans, default=0)
+        mode = "sequential" if sequential else "concurrent"
+        print(f"\nPredicted makespan ({mode} phases): {total:.1f} s")
+
+    def get_product_output(self, product):
+        """Products without an output folder use a subfolder of --output."""
+        if not self.output_path:
+            return ""
+        output_path = Path(self.output_path) / product["name"]
+        output_path.mkdir(exist_ok=True)
+
+        return str(output_path)
+
+    def get_run_name(self):
+        return get_run_name(
+            self.shard,
+            self.locales[0] if self.single_locale else None,
+            self.requested_check,
+            self.requested_phases,
+        )
 
-        # Initialize other error messages
-        self.error_messages = OrderedDict()
-        self.error_summary = {}
-        self.output_cl = {"errors": {}, "warnings": {}}
-        for locale in self.locales:
-            self.error_messages[locale] = []
+    def get_state_name(self, name, product=None):
+        """
+        Returns the name of a file keeping results between runs (e.g.
+        previous_errors.dump), different for each product and kind of run,
+        so that runs of different kinds don't overwrite each other's results.
+        """
+        stem, suffix = os.path.splitext(name)
+        if product is not None and product is not self.products[0]:
+            stem += f"_{product['name']}"
+        run_name = self.get_run_name()
+        if run_name != "full":
+            stem += f"_{run_name}"
 
-        # Run Tranvision checks
-        if not cli_options["tmx"]:
-            self.check_API()
-            if requested_check == "all":
-                self.check_view("variables")
-                self.check_view("shortcuts")
-                self.check_view("empty")
-
-        # Check local TMX for FTL issues if available
-        if requested_check == "all" and self.tmx_path != "":
-            self.check_TMX()
-
-        # Run compare-locales checks if repos are available
-        if (
-            not cli_options["ignore_comparelocales"]
-            and not cli_options["tmx"]
-            and requested_check == "all"
-            and self.firefoxl10n_path != ""
-        ):
-            self.check_repos()
+        return stem + suffix
 
-        # Print errors
-        if self.verbose:
-            self.printErrors()
+    def get_results(self):
+        """Returns all results, reading them from the stream if necessary."""
+        if self.results.sink is None:
+            return self.results
 
-        # Compare with previous run
-        if requested_check == "all":
-            self.compare_previous_run()
+        results = self.results.sink.read_results(self.locales)
+        results.error_summary.update(self.error_summary)
+        results.general_errors.extend(self.general_errors)
+
+        return results
+
+    def getLocaleWeights(self):
+        """
+        Estimate the amount of work for each locale from the size of its TMX
+        cache, which is roughly proportional to the number of translations.
+        """
+        from tmx_cache import cache_path
+
+        weights = {}
+        if self.tmx_path == "":
+            return weights
+        for locale in self.all_locales:
+            cache_file = cache_path(self.tmx_path, locale)
+            if cache_file.exists():
+                weights[locale] = cache_file.stat().st_size
+
+        return weights
+
+    def save_shard_results(self):
+        """Store results for this shard, to be combined by merge_shards.py."""
+        index, count = self.shard
+        output_folder = Path(self.output_path or self.root_folder)
+        shard_file = output_folder / f"partial_results_{index}_of_{count}.json"
+        shard_data = {
+            "shard": [index, count],
+            "locales": self.all_locales,
+            "results": dict(
+                self.get_results().to_dict(), findings=list(self.get_findings())
+            ),
+        }
+        with open(shard_file, "w", encoding="utf-8") as f:
+            json.dump(shard_data, f, indent=2)
+        print(f"Shard results saved in {shard_file}")
 
     def compare_previous_run(self):
         """Compare current results with previous run using ResultsArchiver."""
         archiver = ResultsArchiver(
-            root_folder=Path(self.root_folder), output_path=self.output_path
+            root_folder=Path(self.root_folder),
+            output_path=self.output_path,
+            pickle_name=self.get_state_name("previous_errors.dump"),
         )
+        if self.results.sink is not None:
+            archiver.archive_records(
+                records=self.results.sink.iter_records(),
+                error_summary=self.error_summary,
+            )
+            return
         archiver.archive(
             current_error_messages=self.error_messages,
             output_cl=self.output_cl,
             error_summary=self.error_summary,
         )
 
-    def getJsonData(self, url: str, search_id: str) -> tuple[Any, bool]:
+    def get_findings(self):
+        """
+        Yields findings of strings not excluded from Firefox, reading them
+        from the stream if necessary.
+        """
+        findings = self.results.findings
+        if self.results.sink is not None:
+            findings = self.results.sink.iter_findings()
+        excluded_products = self.products[0]["excluded_products"]
+        for finding in findings:
+            if not finding["string_id"].startswith(excluded_products):
+                yield finding
+
+    def _product_records(self, product):
+        """Returns the streamed errors relevant to a product."""
+        for record in self.results.sink.iter_records():
+            if record.get("product", product["name"]) != product["name"]:
+                continue
+            string_id = get_string_id(record["message"])
+            if string_id and string_id.startswith(product["excluded_products"]):
+                continue
+            yield record
+
+    def compare_products(self):
+        """
+        Compares the results of each product with its previous run, storing
+        them in the product's output folder.
+        """
+        for product in self.products:
+            print(f"\n--------\nProduct: {product['name']}\n")
+
+            # compare-locales runs separately for each product
+            error_summary = {}
+            for check, count in self.error_summary.items():
+                if not check.startswith("compare-locales"):
+                    error_summary[check] = 0
+                elif check == f"compare-locales ({product['name']})":
+                    error_summary["compare-locales"] = count
+            for record in self._product_records(product):
+                if record["phase"] != "compare-locales":
+                    error_summary[record["check"]] += 1
+
+            archiver = ResultsArchiver(
+                root_folder=Path(self.root_folder),
+                output_path=product["output_path"],
+                pickle_name=self.get_state_name("previous_errors.dump", product),
+            )
+            archiver.archive_records(self._product_records(product), error_summary)
+
+    def getJsonData(self, url: str, search_id: str, results=None) -> tuple[Any, bool]:
         """
+        Errors are stored in results, if provided, or in this object.
+
         Return two values:
         - Array of data
         - If the request succeeded (boolean)
         """
-        for _ in range(5):
+        from urllib.request import urlopen
+
+        stats = results or self.results
+        for attempt in range(5):
+            stats.count("requests")
+            if attempt:
+                stats.count("retries")
             try:
-                response = urlopen(url)
-                json_data = json.load(response)
+                content = urlopen(url).read()
+                stats.count("bytes_downloaded", len(content))
+                json_data = json.loads(content)
                 return (json_data, True)
             except Exception as e:
                 print(f"Error fetching remote JSON from {url}: {e}")
                 continue
 
-        self.general_errors.append(f"Error reading {search_id}")
+        (results or self).general_errors.append(f"Error reading {search_id}")
         return ([], False)
 
     def getPluralForms(self):
         """Get the number of plural forms for each locale"""
 
-        from compare_locales.plurals import get_plural
-
         url = f"{self.api_url}/entity/gecko_strings/?id=toolkit/chrome/global/intl.properties:pluralRule"
         if self.verbose:
             print("Reading the list of plural forms")
@@ -822,16 +2164,7 @@ class QualityCheck:
             sys.exit("CRITICAL ERROR: List of plural forms not available")
 
         for locale, rule_number in locales_plural_rules.items():
-            plurals = get_plural(locale)
-            # Fall back to English (2 plural forms)
-            num_plurals = 2
-            if plurals is None:
-                # Temporary fix for szl
-                if locale == "szl":
-                    num_plurals = 3
-            else:
-                num_plurals = len(plurals)
-            self.plural_forms[locale] = num_plurals
+            self.plural_forms[locale] = get_num_plurals(locale)
 
     def getLocales(self):
         """Get the list of supported locales"""
@@ -848,7 +2181,7 @@ class QualityCheck:
         """Print error messages"""
         error_count = 0
         locales_with_errors = OrderedDict()
-        for locale, errors in self.error_messages.items():
+        for locale, errors in self.get_results().error_messages.items():
             if errors:
                 num_errors = len(errors)
                 print(f"\n----\nLocale: {locale} ({num_errors})")
@@ -878,50 +2211,102 @@ class QualityCheck:
             self.general_errors.sort()
             print("\n".join(self.general_errors))
 
-    def sanity_check_JSON(self):
-        """Do a sanity check on JSON files, checking for duplicates"""
-        for json_file in self.json_files:
-            try:
-                checks = json.load(
-                    open(os.path.join(self.root_folder, "checks", json_file + ".json"))
-                )
-            except Exception as e:
-                sys.exit(f"Error loading JSON file {json_file}: {e}")
+    def load_catalog(self):
+        """Returns the checks defined in each JSON file, loaded only once."""
+        if self._catalog is None:
+            catalog = {}
+            for json_file in self.json_files:
+                try:
+                    with open(
+                        os.path.join(self.root_folder, "checks", json_file + ".json"),
+                        encoding="utf-8",
+                    ) as f:
+                        catalog[json_file] = json.load(f)
+                except Exception as e:
+                    sys.exit(f"Error loading JSON file {json_file}: {e}")
+            self._catalog = catalog
+
+        return self._catalog
+
+    def sanity_check_JSON(self, results=None):
+        """
+        Do a sanity check on JSON files, checking for duplicates and regular
+        expressions that are invalid or prone to catastrophic backtracking.
+        """
+        from regex_guard import find_backtracking_risks
 
+        general_errors = (results or self.results).general_errors
+        for json_file, checks in self.load_catalog().items():
             available_checks = []
             for c in checks:
-                id = f"{c['file']}-{c['entity']}-{c['type']}"
+                # Corpus-wide rules have a file pattern and no entity, they're
+                # identified by their regular expressions
+                entity = c.get("entity", "|".join(c.get("checks", [])))
+                id = f"{c['file']}-{entity}-{c['type']}"
                 if id in available_checks:
                     print(f"WARNING: check {id} is duplicated")
                     continue
                 available_checks.append(id)
 
-    def check_API(self):
+                if (
+                    c["type"]
+                    not in (
+                        "include_regex",
+                        "not_include_regex",
+                    )
+                    + CORPUS_CHECK_TYPES
+                ):
+                    continue
+                for pattern in c["checks"]:
+                    try:
+                        risks = find_backtracking_risks(pattern)
+                    except re.error as e:
+                        general_errors.append(
+                            f"Invalid regex in {json_file} ({id}): {pattern} ({e})"
+                        )
+                        continue
+                    if risks:
+                        general_errors.append(
+                            f"Regex prone to catastrophic backtracking in {json_file} "
+                            f"({id}): {pattern} ({', '.join(risks)})"
+                        )
+
+    def get_active_check_files(self):
+        """Returns the check files to run, handling single-check requests."""
+        if self.requested_check == "all":
+            return self.json_files
+        if self.requested_check not in self.json_files:
+            sys.exit(f"ERROR: Requested check ({self.requested_check}) does not exist.")
+
+        return [self.requested_check]
+
+    def check_API(self, results):
         """Check strings via API requests"""
-        self.sanity_check_JSON()
-
-        # Handle single-check requests
-        active_files = self.json_files
-        if self.requested_check != "all":
-            if self.requested_check not in self.json_files:
-                sys.exit(
-                    f"ERROR: Requested check ({self.requested_check}) does not exist."
-                )
-            active_files = [self.requested_check]
+        self.sanity_check_JSON(results)
+        if not self.plural_forms:
+            self.getPluralForms()
+
+        active_files = self.get_active_check_files()
 
         # Initialize and run the extracted checker
         checker = APIChecker(
-            api_url=self.api_url, root_folder=self.root_folder, verbose=self.verbose
+            api_url=self.api_url,
+            root_folder=self.root_folder,
+            verbose=self.verbose,
+            catalog=self.load_catalog(),
+            skipped_types=CORPUS_CHECK_TYPES
+            + (("plural_forms",) if "plurals" in self.phases else ()),
         )
 
         checker.run(
             json_files=active_files,
             locales=self.locales,
             plural_forms=self.plural_forms,
-            results_container=self,
+            results_container=results,
+            checkpoints=self.checkpoints,
         )
 
-    def check_view(self, check_name: str):
+    def check_view(self, check_name: str, results):
         """
         Check views for access keys, keyboard shortcuts, and empty strings.
         """
@@ -940,79 +2325,553 @@ class QualityCheck:
             "empty": "{}/empty-strings/?locale={}&json",
         }
         url = url_templates.get(check_name, "")
+        exceptions = self.load_view_exceptions()
+
+        def run_unit(locale):
+            return self.checkpoints.run_unit(
+                "views",
+                f"{check_name}-{locale}",
+                lambda r: self._check_view_locale(
+                    check_name, url, exceptions, locale, r
+                ),
+            )
+
+        if self.workers > 1:
+            # Start with the longest requests, results are still added in
+            # locale order
+            units = [f"{check_name}-{loc}" for loc in self.locales]
+            costs = self.unit_costs.estimate("views", units)
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    locale: executor.submit(run_unit, locale)
+                    for locale in sorted(
+                        self.locales,
+                        key=lambda loc: -costs[f"{check_name}-{loc}"],
+                    )
+                }
+                for locale in self.locales:
+                    results.add_results(futures[locale].result(), "views", check_name)
+            return
 
-        # 1. Load Centralized Exceptions from JSON
+        for locale in self.locales:
+            results.add_results(run_unit(locale), "views", check_name)
+
+    def _check_view_locale(self, check_name, url, exceptions, locale, results):
+        """Check a view for a single locale."""
+        # Fetch data using the existing getJsonData logic
+        errors, success = self.getJsonData(
+            url.format(self.transvision_url, locale),
+            f"{check_name} for {locale}",
+            results,
+        )
+
+        if not success:
+            results.general_errors.append(
+                f"Error checking *{check_name}* for locale {locale}"
+            )
+            return
+
+        self._add_view_errors(check_name, errors, exceptions, locale, results)
+
+    def load_view_exceptions(self):
+        """Loads exceptions for views, only if the file changed."""
         exceptions_path = Path(self.root_folder) / "exceptions" / "view_exceptions.json"
-        exceptions = {}
-        if exceptions_path.exists():
+        if not exceptions_path.exists():
+            return {}
+        mtime = exceptions_path.stat().st_mtime_ns
+        if self._view_exceptions[0] != mtime:
+            exceptions = {}
             try:
                 with open(exceptions_path, encoding="utf-8") as f:
                     exceptions = json.load(f)
             except json.JSONDecodeError as e:
                 print(f"Error reading exceptions JSON: {e}")
+            self._view_exceptions = (mtime, exceptions)
 
-        total_errors = 0
-        for locale in self.locales:
-            # Fetch data using the existing getJsonData logic
-            errors, success = self.getJsonData(
-                url.format(self.transvision_url, locale),
-                f"{check_name} for {locale}",
+        return self._view_exceptions[1]
+
+    def check_local_views(self, views, results):
+        """
+        Computes views on the local TMX caches instead of Transvision, loading
+        each locale only once for all views.
+        """
+        from local_views import LocalViews
+        from tmx_cache import cache_path, load_cache
+
+        if self.verbose:
+            print(f"CHECK: {', '.join(views)} (local)")
+
+        exceptions = self.load_view_exceptions()
+        if self._local_views is None:
+            self._local_views = LocalViews(
+                load_cache(
+                    cache_path(self.tmx_path, "en-US"),
+                    lambda sid: not sid.startswith(self.excluded_products),
+                )
             )
+        analyzer = self._local_views
 
-            if not success:
-                self.general_errors.append(
-                    f"Error checking *{check_name}* for locale {locale}"
+        for locale in self.locales:
+            cache_file = cache_path(self.tmx_path, locale)
+            locale_data = {}
+
+            def check(check_name, results):
+                if not cache_file.exists():
+                    results.general_errors.append(
+                        f"Error checking *{check_name}* for locale {locale}"
+                    )
+                    return
+                if not locale_data:
+                    locale_data.update(load_cache(cache_file, analyzer.reference))
+                errors = getattr(analyzer, check_name)(locale_data)
+                results.count("strings_checked", len(locale_data))
+                self._add_view_errors(check_name, errors, exceptions, locale, results)
+
+            for check_name in views:
+                unit = self.checkpoints.run_unit(
+                    "views", f"{check_name}-{locale}", lambda r: check(check_name, r)
                 )
+                results.add_results(unit, "views", check_name)
+
+    @staticmethod
+    def is_view_exception(check_name, string_id, locale, exceptions):
+        """Checks if a string is excluded from a view, in general or for a locale."""
+        check_exceptions = exceptions.get(check_name, {})
+        if string_id in check_exceptions.get("exclusions", []):
+            return True
+
+        return string_id in check_exceptions.get("locales", {}).get(locale, [])
+
+    def _add_view_errors(self, check_name, errors, exceptions, locale, results):
+        """Adds errors from a view, ignoring exceptions."""
+        locale_errors = []
+        for error in errors:
+            # Ignore excluded products
+            if error.startswith(self.excluded_products):
                 continue
 
-            # Get locale-specific exceptions for this check type
-            locale_exceptions = (
-                exceptions.get(check_name, {}).get("locales", {}).get(locale, [])
+            # Maintain original error message format
+            # Replaces the first instance of locale with check_name
+            error_msg = f"{locale}: {error}".replace(locale, check_name, 1)
+            reported = not self.is_view_exception(check_name, error, locale, exceptions)
+            if reported:
+                locale_errors.append(error_msg)
+            results.findings.append(
+                {
+                    "phase": "views",
+                    "locale": locale,
+                    "check": check_name,
+                    "message": error_msg,
+                    "string_id": error,
+                    "reported": reported,
+                }
             )
 
-            for error in errors:
-                # Ignore excluded products
-                if error.startswith(self.excluded_products):
-                    continue
+        if locale_errors:
+            results.add_errors(locale, locale_errors, "views", check_name)
+            results.error_summary[check_name] = len(locale_errors)
+
+    def get_repo_locales(self, l10n_path):
+        """Returns the locales checked by compare-locales (None for all)."""
+        if self.single_locale:
+            return self.locales
+        if self.shard:
+            # Split the l10n folders checked by a single-host run the same way
+            # as locales, so that merged shards check the same locales
+            index, count = self.shard
+            return partition_locales(
+                CompareLocalesChecker.get_l10n_locales(l10n_path),
+                count,
+                self.getLocaleWeights(),
+            )[index - 1]
 
-                # Ignore general exclusions
-                if error in exceptions.get(check_name, {}).get("exclusions", []):
-                    continue
+        return None
 
-                if error in locale_exceptions:
-                    continue
+    def get_repo_checkers(self):
+        """Returns a CompareLocalesChecker for each product."""
+        return [
+            CompareLocalesChecker(
+                firefoxl10n_path=product["l10n_path"],
+                toml_path=product["toml_path"],
+                locales=self.get_repo_locales(product["l10n_path"]),
+                verbose=self.verbose,
+                product=product["name"] if len(self.products) > 1 else None,
+            )
+            for product in self.products
+        ]
 
-                # Maintain original error message format
-                # Replaces the first instance of locale with check_name
-                error_msg = f"{locale}: {error}".replace(locale, check_name, 1)
-                self.error_messages[locale].append(error_msg)
-                total_errors += 1
+    def check_repos(self, results):
+        """Run compare-locales against repos using CompareLocalesChecker."""
+        for checker in self.get_repo_checkers():
+            checker.run(results, self.checkpoints)
+
+    def get_corpus_rules(self):
+        """Returns the corpus-wide rules of the active check files."""
+        catalog = self.load_catalog()
+        rules = {}
+        for json_file in self.get_active_check_files():
+            file_rules = [
+                c for c in catalog.get(json_file, []) if c["type"] in CORPUS_CHECK_TYPES
+            ]
+            if file_rules:
+                rules[json_file] = file_rules
 
-        if total_errors:
-            self.error_summary[check_name] = total_errors
+        return rules
 
-    def check_repos(self):
-        """Run compare-locales against repos using CompareLocalesChecker."""
-        checker = CompareLocalesChecker(
-            firefoxl10n_path=self.firefoxl10n_path,
-            toml_path=self.toml_path,
-            locales=self.locales if self.single_locale else [],
-            verbose=self.verbose,
-        )
-        checker.run(self)
+    def check_corpus(self, results):
+        """
+        Evaluates corpus-wide rules on all strings of the TMX caches, e.g.
+
+            {
+              "type": "corpus_not_include_regex",
+              "file": "browser/*.ftl",
+              "checks": ["regex"]
+            }
+
+        reports translations in files matching "file" (glob) that match one
+        of the regular expressions, unless the en-US string matches too. A
+        trigram index of the caches selects candidate strings, and only those
+        are checked with the regular expression.
+        """
+        from regex_guard import RegexGuard
+        from trigram_index import TrigramIndex
+
+        rules = self.get_corpus_rules()
+        if not rules:
+            return
+        if self.verbose:
+            print(f"CHECK: corpus rules in {', '.join(rules)}")
+
+        if self._trigram_index is None:
+            self._trigram_index = TrigramIndex(
+                Path(self.root_folder) / ".trigram_index", self.tmx_path
+            )
+        index = self._trigram_index
+        reference = index.get("en-US", keep=True)
+        if reference is None:
+            results.general_errors.append("Error checking corpus rules for en-US")
+            return
+
+        guard = RegexGuard()
+        reported_offenders = set()
+        # Matches in en-US for each (file pattern, regex)
+        reference_matches = {}
+
+        def search(locale_index, c, pattern):
+            try:
+                return list(locale_index.search(pattern, c["file"], guard))
+            except re.error:
+                # Reported by sanity_check_JSON()
+                return []
+
+        def get_check_name(json_file):
+            # Errors and summary use the same name, separate from API checks
+            # of the same file
+            return f"{json_file} (corpus)"
+
+        for locale in self.locales:
+            locale_index = []
+
+            def check(json_file, results):
+                if not locale_index:
+                    locale_index.append(index.get(locale))
+                if locale_index[0] is None:
+                    results.general_errors.append(
+                        f"Error checking corpus rules for locale {locale}"
+                    )
+                    return
+
+                locale_errors = []
+                for c in rules[json_file]:
+                    if locale in c.get("excluded_locales", []):
+                        continue
+                    if "included_locales" in c and locale not in c["included_locales"]:
+                        continue
+                    for pattern in c["checks"]:
+                        key = (c["file"], pattern)
+                        if key not in reference_matches:
+                            reference_matches[key] = set(search(reference, c, pattern))
+                        matches = search(locale_index[0], c, pattern)
+                        results.count("strings_checked", len(matches))
+                        locale_errors += [
+                            f"String includes {pattern} ({sid})"
+                            for sid in matches
+                            if sid in reference
+                            and not sid.startswith(self.excluded_products)
+                            and sid not in reference_matches[key]
+                        ]
+
+                if locale_errors:
+                    results.add_errors(
+                        locale, locale_errors, "corpus", get_check_name(json_file)
+                    )
+                    results.error_summary[get_check_name(json_file)] = len(
+                        locale_errors
+                    )
+                for msg in guard.pop_offenders():
+                    if msg not in reported_offenders:
+                        reported_offenders.add(msg)
+                        results.general_errors.append(f"{msg} ({json_file})")
+
+            for json_file in rules:
+                unit = self.checkpoints.run_unit(
+                    "corpus", f"{json_file}-{locale}", lambda r: check(json_file, r)
+                )
+                results.add_results(unit, "corpus", get_check_name(json_file))
+
+    def check_plurals(self, results):
+        """
+        Checks the number of plural forms of all plural .properties strings
+        (see PluralIndex) on the TMX caches.
+        """
+        from plural_index import PluralIndex
+        from tmx_cache import cache_path, load_cache
+
+        if self.verbose:
+            print("CHECK: plural forms (local)")
+
+        if self._plural_index is None:
+            reference_file = cache_path(self.tmx_path, "en-US")
+            if not reference_file.exists():
+                results.general_errors.append("Error checking plural forms for en-US")
+                return
+            self._plural_index = PluralIndex(
+                self.enus_path,
+                load_cache(
+                    reference_file,
+                    lambda sid: (
+                        ".properties:" in sid
+                        and not sid.startswith(self.excluded_products)
+                    ),
+                ),
+                [
+                    c
+                    for checks in self.load_catalog().values()
+                    for c in checks
+                    if c["type"] == "plural_forms"
+                ],
+            )
+        index = self._plural_index
+
+        for locale in self.locales:
+
+            def check(results):
+                cache_file = cache_path(self.tmx_path, locale)
+                if not cache_file.exists():
+                    results.general_errors.append(
+                        f"Error checking plural forms for locale {locale}"
+                    )
+                    return
+                locale_data = load_cache(cache_file, index)
+                results.count("strings_checked", len(locale_data))
+                errors = index.validate(locale, locale_data, get_num_plurals(locale))
+                if errors:
+                    results.add_errors(locale, errors, "plurals", "Plural forms")
+                    results.error_summary["Plural forms"] = len(errors)
+
+            unit = self.checkpoints.run_unit("plurals", locale, check)
+            results.add_results(unit, "plurals", "Plural forms")
+
+    def check_outliers(self, results):
+        """
+        Compares translations of each string across all locales with a TMX
+        cache (length relative to en-US, placeables, markup), and reports
+        statistical outliers for the checked locales. Strings can be excluded
+        with the "outliers" type in tmx_exceptions.json.
+
+        The detector is kept between runs (see QualityCheckSession), and only
+        reads again the caches that changed.
+        """
+        from outliers import OutlierDetector
+        from tmx_cache import cache_path, load_cache
+
+        if self.verbose:
+            print("CHECK: outliers across locales")
+
+        def compute(results):
+            reference_file = cache_path(self.tmx_path, "en-US")
+            if not reference_file.exists():
+                results.general_errors.append("Error checking outliers for en-US")
+                return
+
+            mtime = reference_file.stat().st_mtime_ns
+            if self._outlier_detector[0] != mtime:
+                self._outlier_detector = (
+                    mtime,
+                    OutlierDetector(
+                        load_cache(
+                            reference_file,
+                            lambda sid: not sid.startswith(self.excluded_products),
+                        )
+                    ),
+                )
+            detector = self._outlier_detector[1]
+            # Statistics include all locales, even if only some are checked
+            cache_files = {
+                folder.name: cache_path(self.tmx_path, folder.name)
+                for folder in sorted(Path(self.tmx_path).iterdir())
+                if folder.name != "en-US"
+                and cache_path(self.tmx_path, folder.name).exists()
+            }
+            loaded = detector.load(cache_files, self.workers)
+            results.count("strings_checked", len(detector.ids) * loaded)
 
-    def check_TMX(self):
+            exclusions = self.get_tmx_checker().load_exclusions()
+            total_errors = 0
+            checked_locales = [loc for loc in self.locales if loc in cache_files]
+            for locale, outliers in detector.find_outliers(checked_locales).items():
+                locale_errors = []
+                for sid, message in outliers:
+                    reported = not TMXChecker.is_excluded(
+                        sid, locale, exclusions, "outliers"
+                    )
+                    if reported:
+                        locale_errors.append(message)
+                    results.findings.append(
+                        {
+                            "phase": "outliers",
+                            "locale": locale,
+                            "check": "Outliers",
+                            "message": message,
+                            "string_id": sid,
+                            "exclusions": ["outliers"],
+                            "reported": reported,
+                        }
+                    )
+                if locale_errors:
+                    results.add_errors(locale, locale_errors, "outliers", "Outliers")
+                    total_errors += len(locale_errors)
+            results.error_summary["Outliers"] = total_errors
+
+        unit = self.checkpoints.run_unit("outliers", "all", compute)
+        results.add_results(unit, "outliers", "Outliers")
+
+    def get_tmx_checker(self):
+        """Returns the TMXChecker, kept with its exclusions between runs."""
+        if self._tmx_checker is None:
+            self._tmx_checker = TMXChecker(
+                tmx_path=self.tmx_path,
+                root_folder=self.root_folder,
+                excluded_products=self.excluded_products,
+                verbose=self.verbose,
+                source=self.source,
+                l10n_path=self.firefoxl10n_path,
+                enus_path=self.enus_path,
+            )
+
+        return self._tmx_checker
+
+    def check_TMX(self, results):
         """Check local TMX for issues, mostly on FTL files"""
         if self.verbose:
             print("Running TMX checks...")
 
-        checker = TMXChecker(
-            tmx_path=self.tmx_path,
-            root_folder=self.root_folder,
-            excluded_products=self.excluded_products,
-            verbose=self.verbose,
+        self.get_tmx_checker().run(
+            self.locales,
+            results,
+            self.checkpoints,
+            workers=self.workers,
+            costs=self.unit_costs.estimate(
+                "tmx", self.locales, self.getLocaleWeights()
+            ),
         )
-        checker.run(self.locales, self)
+
+
+class QualityCheckSession(QualityCheck):
+    """
+    Runs checks repeatedly in the same process, e.g. from other tools.
+
+    Configuration, locales, plural forms, check definitions and the en-US
+    reference are loaded once, and reused by each run. Exceptions are
+    reloaded only when their files change. Runs don't print, store or
+    compare results, they only return them.
+    """
+
+    def __init__(
+        self,
+        root_folder=ROOT_DIR,
+        config_path=None,
+        source="tmx",
+        local_views=False,
+        locales=None,
+        local_plurals=False,
+        outliers=False,
+    ):
+        config_data = load_config(
+            Path(config_path or Path(root_folder) / "config" / "config.ini")
+        )
+        if config_data is None:
+            raise FileNotFoundError("config.ini not found or could not be loaded.")
+
+        self._configure(
+            root_folder=str(root_folder),
+            tmx_path=str(config_data["tmx_path"]),
+            firefoxl10n_path=str(config_data["firefoxl10n_path"]),
+            toml_path=str(config_data["toml_path"]),
+            requested_check="all",
+            cli_options={
+                "verbose": False,
+                "locale": None,
+                "source": source,
+                "local_views": local_views,
+                "local_plurals": local_plurals,
+                "outliers": outliers,
+            },
+            output_path="",
+            enus_path=config_data["enus_path"],
+            products=None,
+        )
+        self.results = ResultsContainer([])
+        self.check_files = []
+
+        if locales is None:
+            self.getLocales()
+        else:
+            self.locales = list(locales)
+        self.all_locales = list(self.locales)
+        self.plural_forms = {}
+
+    def get_active_check_files(self):
+        return self.check_files or self.json_files
+
+    def run(self, locales=None, checks=None):
+        """
+        Runs checks on locales (all by default), and returns a
+        ResultsContainer. Checks can be phases (e.g. "tmx", all by default)
+        or check files for API checks (e.g. "browser").
+        """
+        checks = list(checks or CHECK_PROVIDERS)
+        self.check_files = [c for c in checks if c not in CHECK_PROVIDERS]
+        unknown = set(self.check_files) - set(self.json_files)
+        if unknown:
+            raise ValueError(f"Unknown checks: {', '.join(sorted(unknown))}")
+        phases = {c for c in checks if c in CHECK_PROVIDERS}
+        if self.check_files:
+            phases.update(("api", "corpus", "plurals"))
+
+        # compare-locales only checks the requested locales
+        self.locales = list(locales or self.all_locales)
+        self.single_locale = locales is not None
+        self.results = ResultsContainer(self.locales)
+        self.error_messages = self.results.error_messages
+        self.error_summary = self.results.error_summary
+        self.output_cl = self.results.output_cl
+        self.general_errors = self.results.general_errors
+        self.checkpoints = Checkpoints()
+
+        from run_metrics import RunMetrics
+
+        self.metrics = RunMetrics()
+        providers = [
+            p
+            for name, p in CHECK_PROVIDERS.items()
+            if name in phases and p.is_available(self)
+        ]
+        self.phases = [p.name for p in providers]
+        # Phases run in this process, to keep data loaded between runs
+        PhaseScheduler(providers, sequential=True).run(self)
+
+        return self.results
 
 
 def main():
@@ -1030,6 +2889,86 @@ def main():
         help="Don't run compare-locales checks",
         action="store_true",
     )
+    cl_parser.add_argument(
+        "--phase",
+        dest="phases",
+        action="append",
+        choices=list(CHECK_PROVIDERS),
+        help="Only run the selected phase (can be repeated): "
+        + "; ".join(f"{p.name}: {p.description}" for p in CHECK_PROVIDERS.values()),
+    )
+    cl_parser.add_argument(
+        "--sequential",
+        dest="sequential",
+        help="Run phases one after the other instead of concurrently",
+        action="store_true",
+    )
+    cl_parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Only run the i-th of N groups of locales (i/N), partial results "
+        "are saved for merge_shards.py",
+    )
+    cl_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write errors to a JSON Lines file in the output folder (e.g. "
+        "results.jsonl for full runs) while checks are running, instead of "
+        "keeping them in memory",
+    )
+    cl_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run, skipping work already completed",
+    )
+    cl_parser.add_argument(
+        "--local-views",
+        dest="local_views",
+        action="store_true",
+        help="Compute views (variables, shortcuts, empty strings) on the local "
+        "TMX caches instead of using Transvision",
+    )
+    cl_parser.add_argument(
+        "--local-plurals",
+        dest="local_plurals",
+        action="store_true",
+        help="Check plural forms of all plural .properties strings on the local "
+        "TMX caches, instead of the strings in checks/*.json via Transvision",
+    )
+    cl_parser.add_argument(
+        "--outliers",
+        dest="outliers",
+        action="store_true",
+        help="Compare translations across all locales with a TMX cache, and "
+        "report outliers (length, placeables, markup)",
+    )
+    cl_parser.add_argument(
+        "--source",
+        choices=["tmx", "l10n"],
+        default="tmx",
+        help="Where TMX checks read FTL strings from: TMX caches (default), or "
+        ".ftl files in the l10n and en-US repositories",
+    )
+    cl_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes for TMX checks (threads for Transvision "
+        "views), longest units are started first",
+    )
+    cl_parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the predicted schedule and duration of the run, based on "
+        "previous runs, without running checks",
+    )
+    cl_parser.add_argument(
+        "--product",
+        dest="products",
+        action="append",
+        help="Only check the selected product from config.ini, in addition to "
+        "Firefox (can be repeated)",
+    )
     cl_parser.add_argument(
         "--output",
         nargs="?",
@@ -1037,6 +2976,8 @@ def main():
         default="",
     )
     args = cl_parser.parse_args()
+    if args.shard and args.locale:
+        cl_parser.error("--shard can't be used with --locale")
 
     # Check if there's a config file (optional)
     config_path = ROOT_DIR / "config" / "config.ini"
@@ -1046,15 +2987,43 @@ def main():
         print("Please create a config.ini file before running this script.")
         sys.exit(1)
 
-    lock_file = ROOT_DIR / ".running"
-
-    # Use context manager to handle the lifecycle of the lock file
-    with execution_lock(lock_file):
+    products = config_data["products"]
+    if args.products:
+        unknown = set(args.products) - {p["name"] for p in products}
+        if unknown:
+            cl_parser.error(f"Unknown products: {', '.join(sorted(unknown))}")
+        products = [p for p in products if p["name"] in args.products]
+    if args.shard and products:
+        cl_parser.error("--shard can't be used with multiple products")
+
+    # Runs writing the same results (previous_errors.dump, output folders)
+    # can't run at the same time, other runs only share read-only data
+    output_folders = []
+    if not args.shard:
+        output_folders = [args.output] + [p["output_path"] for p in products]
+    run_name = get_run_name(args.shard, args.locale, args.check, args.phases)
+    lock = (
+        nullcontext()
+        if args.plan
+        else run_lock(ROOT_DIR, run_name, [f for f in output_folders if f])
+    )
+    with lock:
         cli_options = {
             "verbose": args.verbose,
             "tmx": args.tmx,
             "ignore_comparelocales": args.ignore_comparelocales,
             "locale": args.locale,
+            "phases": args.phases,
+            "sequential": args.sequential,
+            "shard": args.shard,
+            "stream": args.stream,
+            "resume": args.resume,
+            "source": args.source,
+            "local_views": args.local_views,
+            "local_plurals": args.local_plurals,
+            "outliers": args.outliers,
+            "workers": max(1, args.workers),
+            "plan": args.plan,
         }
 
         QualityCheck(
@@ -1065,6 +3034,8 @@ def main():
             requested_check=args.check,
             cli_options=cli_options,
             output_path=args.output,
+            enus_path=config_data["enus_path"],
+            products=products,
         )
 
 
@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
+import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Folders containing JSON files maintained by hand
+JSON_FOLDERS = ["checks", "exceptions"]
+
+
 def reorder_node(node):
     """Reorder arrays in nodes recursively"""
 
@@ -21,18 +28,55 @@ def reorder_node(node):
             reorder_node(sub_node)
 
 
+def reformat_file(file_path, check_only):
+    """
+    Normalize a JSON file, only writing it if the content changed.
+
+    Return True if the file is (or was) not normalized.
+    """
+    original = file_path.read_bytes()
+    json_data = json.loads(original)
+    reorder_node(json_data)
+    normalized = (json.dumps(json_data, indent=2, sort_keys=True) + "\n").encode(
+        "utf-8"
+    )
+
+    if normalized == original:
+        return False
+    if not check_only:
+        file_path.write_bytes(normalized)
+
+    return True
+
+
 def main():
+    cl_parser = argparse.ArgumentParser(
+        description="Sort and reformat JSON files in checks and exceptions"
+    )
+    cl_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write files, exit with an error if any file needs reformatting",
+    )
+    args = cl_parser.parse_args()
+
     root_path = Path(__file__).resolve().parent.parent
+    json_files = sorted(
+        file_path
+        for folder in JSON_FOLDERS
+        for file_path in (root_path / folder).rglob("*.json")
+    )
 
-    for file_path in root_path.rglob("*.json"):
-        with open(file_path, encoding="utf-8") as f:
-            json_data = json.load(f)
+    with ThreadPoolExecutor() as executor:
+        changed = list(executor.map(lambda f: reformat_file(f, args.check), json_files))
 
-        reorder_node(json_data)
+    changed_files = [f for f, c in zip(json_files, changed) if c]
+    for file_path in changed_files:
+        action = "Needs reformatting" if args.check else "Reformatted"
+        print(f"{action}: {file_path.relative_to(root_path)}")
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, sort_keys=True)
-            f.write("\n")
+    if args.check and changed_files:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pickle
+import re
+import select
+import subprocess
+import sys
+import threading
+
+from re import _constants as sre_constants, _parser as sre_parser
+
+
+# Maximum time (in seconds) spent on a single search
+TIME_BUDGET = 0.5
+
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: r"\d",
+    sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+    sre_constants.CATEGORY_SPACE: r"\s",
+    sre_constants.CATEGORY_NOT_SPACE: r"\S",
+    sre_constants.CATEGORY_WORD: r"\w",
+    sre_constants.CATEGORY_NOT_WORD: r"\W",
+}
+
+
+def _is_unbounded(av):
+    return av[1] == sre_constants.MAXREPEAT
+
+
+def _find_unbounded_repeat(subpattern):
+    """Returns True if subpattern contains an unbounded, backtracking repeat."""
+    for op, av in subpattern:
+        if op in REPEATS:
+            if _is_unbounded(av) or _find_unbounded_repeat(av[2]):
+                return True
+        elif op == sre_constants.SUBPATTERN:
+            if _find_unbounded_repeat(av[3]):
+                return True
+        elif op == sre_constants.BRANCH:
+            if any(_find_unbounded_repeat(branch) for branch in av[1]):
+                return True
+        # Possessive repeats and atomic groups never backtrack into their
+        # content, lookarounds are ignored
+
+    return False
+
+
+def _in_class(item, char):
+    op, av = item
+    if op == sre_constants.LITERAL:
+        return chr(av) == char
+    if op == sre_constants.RANGE:
+        return av[0] <= ord(char) <= av[1]
+    if op == sre_constants.CATEGORY and av in CATEGORIES:
+        return re.fullmatch(CATEGORIES[av], char) is not None
+    # Not supported, assume it matches
+    return True
+
+
+def _can_match(item, char):
+    """
+    Checks if a single-character element (literal, class) can match char,
+    ignoring case to also cover patterns with (?i). Unsupported elements are
+    assumed to match.
+    """
+    op, av = item
+    if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+        equal = re.fullmatch(f"(?i){re.escape(chr(av))}", char) is not None
+        return equal if op == sre_constants.LITERAL else not equal
+    if op == sre_constants.IN:
+        negate = bool(av) and av[0][0] == sre_constants.NEGATE
+        items = av[1:] if negate else av
+        variants = {c for c in (char, char.lower(), char.upper()) if len(c) == 1}
+        return any(any(_in_class(i, c) for i in items) != negate for c in variants)
+    return True
+
+
+def _ends_with_separator(body):
+    """
+    Checks if each repetition of body ends with a literal that no unbounded
+    repeat in it can match (e.g. "(?:x+y)+"): repetitions can only be split
+    one way, so there's no catastrophic backtracking.
+    """
+    while len(body) == 1 and body[0][0] == sre_constants.SUBPATTERN:
+        body = body[0][1][3]
+    if not body or body[-1][0] != sre_constants.LITERAL:
+        return False
+
+    separator = chr(body[-1][1])
+    for op, av in body[:-1]:
+        if op in REPEATS and _is_unbounded(av):
+            content = av[2]
+            if len(content) != 1 or _can_match(content[0], separator):
+                return False
+        elif _find_unbounded_repeat([(op, av)]):
+            return False
+
+    return True
+
+
+def _find_risks(subpattern, risks):
+    for op, av in subpattern:
+        if op in REPEATS:
+            if (
+                _is_unbounded(av)
+                and _find_unbounded_repeat(av[2])
+                and not _ends_with_separator(av[2])
+            ):
+                risks.append("nested quantifiers")
+            else:
+                _find_risks(av[2], risks)
+        elif op == sre_constants.SUBPATTERN:
+            _find_risks(av[3], risks)
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                _find_risks(branch, risks)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            _find_risks(av[1], risks)
+
+
+def find_backtracking_risks(pattern):
+    """
+    Returns the reasons why a pattern is prone to catastrophic backtracking
+    (e.g. "(a+)*"), or an empty list. Invalid patterns raise re.error.
+    """
+    risks = []
+    _find_risks(sre_parser.parse(pattern), risks)
+
+    return sorted(set(risks))
+
+
+class RegexGuard:
+    """
+    Runs searches for user-defined patterns with a time budget, interrupting
+    searches once over budget.
+
+    Searches use the timeout of the regex module (see requirements.txt). If
+    it's not installed, they run with the re module in a worker process,
+    which is killed (and started again for the next search) when a search
+    exceeds the budget.
+    """
+
+    def __init__(self, time_budget=TIME_BUDGET):
+        self.time_budget = time_budget
+        # Error messages for patterns that exceeded the budget
+        self.offenders = {}
+        # Patterns that exceeded the budget once, not evaluated anymore
+        self.timed_out = set()
+        try:
+            import regex  # noqa: F401
+
+            self.has_regex = True
+        except ImportError:
+            self.has_regex = False
+        # Worker process running searches without the regex module
+        self.worker = None
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # Worker processes can't be shared, a copy starts its own
+        return dict(self.__dict__, worker=None, lock=None)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def _search_in_worker(self, pattern, text):
+        with self.lock:
+            if self.worker is None:
+                self.worker = subprocess.Popen(
+                    [sys.executable, __file__],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+            pickle.dump((pattern, text), self.worker.stdin)
+            self.worker.stdin.flush()
+            ready, _, _ = select.select([self.worker.stdout], [], [], self.time_budget)
+            if not ready:
+                self.worker.kill()
+                self.worker.wait()
+                self.worker = None
+                raise TimeoutError
+            matched, error = pickle.load(self.worker.stdout)
+        if error is not None:
+            raise re.error(error)
+
+        return matched
+
+    def search(self, pattern, text):
+        """Returns True if pattern matches text, None if it couldn't be evaluated."""
+        if pattern in self.timed_out:
+            self._add_offender(pattern)
+            return None
+
+        try:
+            if self.has_regex:
+                import regex
+
+                try:
+                    match = regex.search(
+                        pattern, text, regex.UNICODE, timeout=self.time_budget
+                    )
+                except regex.error as e:
+                    raise re.error(str(e)) from e
+                return match is not None
+
+            return self._search_in_worker(pattern, text)
+        except TimeoutError:
+            self.timed_out.add(pattern)
+            self._add_offender(pattern)
+            return None
+
+    def _add_offender(self, pattern):
+        self.offenders[pattern] = (
+            f"Regex exceeded the time budget ({self.time_budget} s): {pattern}"
+        )
+
+    def pop_offenders(self):
+        offenders = sorted(self.offenders.values())
+        self.offenders = {}
+
+        return offenders
+
+
+def _serve():
+    """Runs searches sent by RegexGuard on stdin, until it's closed."""
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    while True:
+        try:
+            pattern, text = pickle.load(stdin)
+        except EOFError:
+            return
+        try:
+            result = (re.search(pattern, text, re.UNICODE) is not None, None)
+        except re.error as e:
+            result = (False, str(e))
+        pickle.dump(result, stdout)
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    _serve()
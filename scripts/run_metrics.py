@@ -0,0 +1,318 @@
+#! /usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import argparse
+import datetime
+import json
+import os
+import statistics
+import sys
+import time
+
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Counters collected by each phase, see ResultsContainer.count()
+COUNTERS = ["requests", "retries", "bytes_downloaded", "strings_checked"]
+
+# Used to estimate units of work without history from their size (e.g. the
+# size of the TMX cache for a locale), until a run provides the actual rate
+DEFAULT_BYTES_PER_SECOND = 1 << 20
+
+
+def get_peak_rss():
+    """Returns the peak RSS (in bytes) of this process and its children."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RunMetrics:
+    """Collects performance metrics for a run of the checks."""
+
+    def __init__(self):
+        self.start_time = time.monotonic()
+        self.record = {
+            "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "phases": {},
+        }
+
+    def add_phase(self, phase, duration, stats):
+        phase_metrics = {"duration": round(duration, 3)}
+        for counter in COUNTERS:
+            phase_metrics[counter] = stats.get(counter, 0)
+        phase_metrics["strings_per_second"] = (
+            round(phase_metrics["strings_checked"] / duration, 1) if duration else 0
+        )
+        self.record["phases"][phase] = phase_metrics
+
+    def finish(self, run_name, total_errors):
+        """Completes the record, run_name identifies the kind of run."""
+        self.record["run"] = run_name
+        self.record["duration"] = round(time.monotonic() - self.start_time, 3)
+        self.record["errors"] = total_errors
+        self.record["peak_rss"] = get_peak_rss()
+
+    def to_openmetrics(self):
+        """Formats the record in OpenMetrics text format."""
+        prefix = "l10n_checks"
+        run_label = f'run="{self.record["run"]}"'
+        lines = [
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds{{{run_label}}} {self.record['duration']}",
+            f"# TYPE {prefix}_errors gauge",
+            f"{prefix}_errors{{{run_label}}} {self.record['errors']}",
+        ]
+        if self.record["peak_rss"] is not None:
+            lines += [
+                f"# TYPE {prefix}_peak_rss_bytes gauge",
+                f"{prefix}_peak_rss_bytes{{{run_label}}} {self.record['peak_rss']}",
+            ]
+        metric_names = {
+            "duration": ("phase_duration_seconds", "gauge"),
+            "requests": ("phase_requests", "gauge"),
+            "retries": ("phase_retries", "gauge"),
+            "bytes_downloaded": ("phase_downloaded_bytes", "gauge"),
+            "strings_checked": ("phase_strings_checked", "gauge"),
+            "strings_per_second": ("phase_strings_per_second", "gauge"),
+        }
+        for key, (name, metric_type) in metric_names.items():
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for phase, phase_metrics in self.record["phases"].items():
+                labels = f'{run_label},phase="{phase}"'
+                lines.append(f"{prefix}_{name}{{{labels}}} {phase_metrics[key]}")
+        lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+    def save(self, output_folder: Path):
+        """
+        Saves the record as metrics.json, appends it to metrics_history.jsonl,
+        and exports it as metrics.prom for a node exporter.
+        """
+        from file_lock import file_lock
+
+        output_folder = Path(output_folder)
+        # Runs of different kinds can share the output folder
+        with file_lock(output_folder / "metrics.lock"):
+            with open(output_folder / "metrics.json", "w", encoding="utf-8") as f:
+                json.dump(self.record, f, indent=2, sort_keys=True)
+            with open(
+                output_folder / "metrics_history.jsonl", "a", encoding="utf-8"
+            ) as f:
+                f.write(json.dumps(self.record, sort_keys=True) + "\n")
+
+            # The collector must never read a partially written file
+            prom_file = output_folder / "metrics.prom"
+            temp_file = prom_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(self.to_openmetrics())
+            os.replace(temp_file, prom_file)
+
+
+class UnitCosts:
+    """
+    Durations of units of work (e.g. a TMX locale, a check file) in previous
+    runs, stored in unit_costs.json and used to schedule the longest units
+    first. Durations are averaged with the previous value, to smooth out
+    noise from a single run.
+    """
+
+    def __init__(self, costs_file: Path):
+        self.costs_file = Path(costs_file)
+        self.costs = self._load()
+        # Costs updated by this run
+        self.updated = set()
+
+    def _load(self):
+        if not self.costs_file.exists():
+            return {}
+        try:
+            with open(self.costs_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {self.costs_file}: {e}")
+            return {}
+
+    def get(self, phase, unit):
+        return self.costs.get(f"{phase}/{unit}")
+
+    def estimate(self, phase, units, sizes=None):
+        """
+        Returns the estimated duration of each unit. Units without history
+        are estimated from their size, if available, or use the average
+        duration of the other units (1 s without history).
+        """
+        sizes = sizes or {}
+        known = {u: self.get(phase, u) for u in units}
+        known = {u: cost for u, cost in known.items() if cost is not None}
+
+        sized = [u for u in known if sizes.get(u)]
+        bytes_per_second = DEFAULT_BYTES_PER_SECOND
+        if sized and sum(known[u] for u in sized):
+            bytes_per_second = sum(sizes[u] for u in sized) / sum(
+                known[u] for u in sized
+            )
+        average = sum(known.values()) / len(known) if known else 1.0
+
+        costs = {}
+        for unit in units:
+            if unit in known:
+                costs[unit] = known[unit]
+            elif sizes.get(unit):
+                costs[unit] = sizes[unit] / bytes_per_second
+            else:
+                costs[unit] = average
+
+        return costs
+
+    def update(self, durations):
+        """Updates costs with durations of units ({"phase/unit": seconds})."""
+        for key, duration in durations.items():
+            previous = self.costs.get(key)
+            if previous is not None:
+                duration = (previous + duration) / 2
+            self.costs[key] = round(duration, 3)
+            self.updated.add(key)
+
+    def save(self):
+        """Saves updated costs, keeping costs saved by other runs meanwhile."""
+        from file_lock import file_lock
+
+        with file_lock(self.costs_file.with_suffix(".lock")):
+            costs = self._load()
+            costs.update({key: self.costs[key] for key in self.updated})
+            temp_file = self.costs_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(costs, f, indent=2, sort_keys=True)
+            os.replace(temp_file, self.costs_file)
+
+
+def lpt_schedule(units, costs, workers):
+    """
+    Assigns units to workers, longest first, each to the least loaded worker
+    (LPT). Returns a list of (units, load) for each worker, units in the
+    order they're started. Ties are broken by name, so the result only
+    depends on the units and their costs.
+    """
+    assigned = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for unit in sorted(units, key=lambda u: (-costs.get(u, 1), u)):
+        worker = min(range(workers), key=lambda i: (loads[i], i))
+        assigned[worker].append(unit)
+        loads[worker] += costs.get(unit, 1)
+
+    return list(zip(assigned, loads))
+
+
+def load_history(history_file: Path, run_name):
+    history = []
+    with open(history_file, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if record.get("run") == run_name:
+                    history.append(record)
+
+    return history
+
+
+def find_regressions(history, threshold, window):
+    """
+    Compares the last run with the median of the previous runs (up to
+    window), returning phases slower than median * threshold.
+    """
+    if len(history) < 2:
+        return []
+
+    latest = history[-1]
+    previous = history[-window - 1 : -1]
+    regressions = []
+    for phase, phase_metrics in latest["phases"].items():
+        durations = [
+            r["phases"][phase]["duration"] for r in previous if phase in r["phases"]
+        ]
+        if not durations:
+            continue
+        median = statistics.median(durations)
+        if median and phase_metrics["duration"] > median * threshold:
+            regressions.append((phase, phase_metrics["duration"], median))
+
+    return regressions
+
+
+def main():
+    cl_parser = argparse.ArgumentParser(
+        description="Report phases that regressed compared to previous runs"
+    )
+    cl_parser.add_argument(
+        "--output",
+        help="Folder passed as --output to qualitychecks.py, where the history "
+        "is saved (defaults to the root folder)",
+        default="",
+    )
+    cl_parser.add_argument(
+        "--history",
+        help="Path to metrics_history.jsonl (overrides --output)",
+        default="",
+    )
+    cl_parser.add_argument(
+        "--run", help="Kind of run to compare (e.g. full, locale-it)", default="full"
+    )
+    cl_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Ratio to the trailing median considered a regression",
+    )
+    cl_parser.add_argument(
+        "--window", type=int, default=7, help="Number of previous runs to compare"
+    )
+    args = cl_parser.parse_args()
+
+    # Same location as RunMetrics.save() in qualitychecks.py
+    history_file = Path(
+        args.history or Path(args.output or ROOT_DIR) / "metrics_history.jsonl"
+    )
+    if not history_file.exists():
+        sys.exit(f"ERROR: {history_file} not found.")
+    history = load_history(history_file, args.run)
+    if len(history) < 2:
+        sys.exit(f"Not enough runs ({len(history)}) to compare.")
+
+    latest = history[-1]
+    print(f"Run: {latest['date']} ({latest['duration']} s)")
+    for phase, phase_metrics in latest["phases"].items():
+        print(
+            f"- {phase}: {phase_metrics['duration']} s, "
+            f"{phase_metrics['requests']} requests "
+            f"({phase_metrics['retries']} retries), "
+            f"{phase_metrics['strings_per_second']} strings/s"
+        )
+
+    regressions = find_regressions(history, args.threshold, args.window)
+    if not regressions:
+        print("No regressions.")
+        return
+
+    print(f"\nRegressions (over {args.threshold}x the trailing median):")
+    for phase, duration, median in regressions:
+        print(f"- {phase}: {duration} s (median {median} s)")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
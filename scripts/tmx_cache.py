@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+import re
+
+from json.decoder import scanstring
+from pathlib import Path
+
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def cache_path(tmx_path, locale, repository="gecko_strings") -> Path:
+    """Returns the path to the TMX cache (JSON) for a locale."""
+    return Path(tmx_path) / locale / f"cache_{locale}_{repository}.json"
+
+
+class _ChunkedJSONReader:
+    """Decodes JSON values from a file, reading it in chunks."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has already been consumed
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def next_char(self):
+        """Consumes whitespace and returns the next character ("" at EOF)."""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                return ""
+
+    def expect(self, chars):
+        char = self.next_char()
+        if char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r}, found {char!r} in {self.f.name}"
+            )
+        self.pos += 1
+        return char
+
+    def decode(self):
+        """Decodes the next value, reading more data if it's incomplete."""
+        is_string = self.next_char() == '"'
+        while True:
+            try:
+                if is_string:
+                    value, end = scanstring(self.buffer, self.pos + 1)
+                else:
+                    value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A value ending with the buffer (e.g. a number) might continue
+                # in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._read_more()
+
+
+def iter_cache(cache_file, chunk_size=CHUNK_SIZE):
+    """
+    Yields (string ID, translation) pairs from a TMX cache, without loading
+    the entire file in memory.
+    """
+    with open(cache_file, encoding="utf-8") as f:
+        reader = _ChunkedJSONReader(f, chunk_size)
+        reader.expect("{")
+        if reader.next_char() == "}":
+            return
+        while True:
+            string_id = reader.decode()
+            reader.expect(":")
+            yield string_id, reader.decode()
+            if reader.expect(",}") == "}":
+                return
+
+
+def load_cache(cache_file, keep=None, chunk_size=CHUNK_SIZE):
+    """
+    Loads a TMX cache, only storing string IDs accepted by keep (either a
+    container of IDs or a function). Without keep, all strings are stored.
+    """
+    if keep is None:
+        return dict(iter_cache(cache_file, chunk_size))
+    if not callable(keep):
+        keep = keep.__contains__
+
+    return {
+        string_id: text
+        for string_id, text in iter_cache(cache_file, chunk_size)
+        if keep(string_id)
+    }
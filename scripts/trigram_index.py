@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pickle
+
+from _sre import unicode_tolower
+from array import array
+from fnmatch import fnmatchcase
+from pathlib import Path
+from re import _constants as sre_constants, _parser as sre_parser
+from re._casefix import _EXTRA_CASES
+
+from file_lock import file_lock
+from tmx_cache import cache_path, iter_cache
+
+
+# Increase when the format of index files changes
+INDEX_VERSION = 3
+
+REPEATS = (
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    sre_constants.POSSESSIVE_REPEAT,
+)
+
+
+class _CaseFolding(dict):
+    """
+    Table for str.translate(), mapping each character to one character for
+    all the forms that re considers equal when ignoring case: the simple
+    lowercase used by re (e.g. "i" for "İ", unlike lower() and casefold()),
+    then the same character for equivalent ones (e.g. "ı" and "i", final and
+    non-final sigma).
+    """
+
+    def __missing__(self, code):
+        lower = unicode_tolower(code)
+        folded = min((lower, *_EXTRA_CASES.get(lower, ())))
+        self[code] = folded
+        return folded
+
+
+_case_folding = _CaseFolding()
+
+
+def get_trigrams(text):
+    """Returns the trigrams of a text, ignoring case like re."""
+    text = text.translate(_case_folding)
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _find_literals(subpattern, literals):
+    current = ""
+    for op, av in subpattern:
+        if op == sre_constants.LITERAL:
+            current += chr(av)
+            continue
+
+        # Any other element ends the current sequence of characters
+        literals.append(current)
+        current = ""
+        if op == sre_constants.SUBPATTERN:
+            _find_literals(av[3], literals)
+        elif op == sre_constants.ATOMIC_GROUP:
+            _find_literals(av, literals)
+        elif op in REPEATS and av[0] > 0:
+            _find_literals(av[2], literals)
+        # Alternatives, optional elements and classes of characters don't
+        # provide required text
+    literals.append(current)
+
+
+def get_required_trigrams(pattern):
+    """
+    Returns trigrams that any text matching the pattern must contain, based
+    on the sequences of literal characters in it. Invalid patterns raise
+    re.error.
+    """
+    literals = []
+    _find_literals(sre_parser.parse(pattern), literals)
+
+    return set().union(*(get_trigrams(literal) for literal in literals))
+
+
+class LocaleIndex:
+    """Strings of a TMX cache, with the position of strings by trigram."""
+
+    def __init__(self, ids, texts, postings):
+        self.ids = ids
+        self.texts = texts
+        self.postings = postings
+        self.positions = {string_id: i for i, string_id in enumerate(ids)}
+
+    @classmethod
+    def build(cls, cache_file):
+        ids = []
+        texts = []
+        postings = {}
+        for i, (string_id, text) in enumerate(iter_cache(cache_file)):
+            ids.append(string_id)
+            texts.append(text)
+            for trigram in get_trigrams(text):
+                postings.setdefault(trigram, array("I")).append(i)
+
+        return cls(ids, texts, postings)
+
+    def __contains__(self, string_id):
+        return string_id in self.positions
+
+    def __len__(self):
+        return len(self.ids)
+
+    def candidates(self, pattern):
+        """Positions of the strings that might match the pattern."""
+        trigrams = get_required_trigrams(pattern)
+        if not trigrams:
+            return range(len(self.ids))
+
+        # Intersect from the least common trigram
+        postings = sorted(
+            (self.postings.get(trigram, ()) for trigram in trigrams), key=len
+        )
+        positions = set(postings[0])
+        for posting in postings[1:]:
+            if not positions:
+                break
+            positions.intersection_update(posting)
+
+        return sorted(positions)
+
+    def search(self, pattern, file_pattern, guard):
+        """
+        Yields the IDs of strings in files matching file_pattern (glob) with
+        a text matching pattern, verified on candidates with a RegexGuard.
+        """
+        for i in self.candidates(pattern):
+            string_id = self.ids[i]
+            if not fnmatchcase(string_id.split(":", 1)[0], file_pattern):
+                continue
+            if guard.search(pattern, self.texts[i]):
+                yield string_id
+
+
+class TrigramIndex:
+    """
+    Trigram indexes of the TMX caches, stored in index_folder (one file per
+    locale). The index of a locale is only rebuilt when its cache changes.
+
+    Several runs can read an index at the same time, while rebuilding it
+    requires an exclusive lock.
+    """
+
+    def __init__(self, index_folder: Path, tmx_path):
+        self.index_folder = Path(index_folder)
+        self.tmx_path = tmx_path
+        # Indexes kept in memory (see get())
+        self.loaded = {}
+
+    def _get_signature(self, cache_file):
+        stat = cache_file.stat()
+        return [INDEX_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    def _load(self, index_file, signature):
+        """Returns the index stored in index_file, if still up to date."""
+        if not index_file.exists():
+            return None
+        try:
+            with open(index_file, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            print(f"Error loading trigram index {index_file}: {e}")
+            return None
+        if data["signature"] != signature:
+            return None
+
+        return LocaleIndex(data["ids"], data["texts"], data["postings"])
+
+    def _save(self, index_file, signature, index):
+        # Write to a temporary file first, to never leave a partial index
+        tmp_file = index_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(
+                {
+                    "signature": signature,
+                    "ids": index.ids,
+                    "texts": index.texts,
+                    "postings": index.postings,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        tmp_file.replace(index_file)
+
+    def get(self, locale, keep=False):
+        """
+        Returns the index for a locale, or None if there's no TMX cache. With
+        keep, the index stays in memory for the following calls.
+        """
+        cache_file = cache_path(self.tmx_path, locale)
+        if not cache_file.exists():
+            return None
+        signature = self._get_signature(cache_file)
+        if locale in self.loaded and self.loaded[locale][0] == signature:
+            return self.loaded[locale][1]
+
+        index_file = self.index_folder / f"{locale}.pickle"
+        lock_file = self.index_folder / f"{locale}.lock"
+        with file_lock(lock_file, shared=True):
+            index = self._load(index_file, signature)
+
+        if index is None:
+            with file_lock(lock_file):
+                # Another run might have rebuilt the index in the meantime
+                index = self._load(index_file, signature)
+                if index is None:
+                    index = LocaleIndex.build(cache_file)
+                    self._save(index_file, signature, index)
+
+        if keep:
+            self.loaded[locale] = (signature, index)
+
+        return index
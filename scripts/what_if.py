@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import argparse
+import json
+import sys
+
+from pathlib import Path
+
+from qualitychecks import FINDINGS_FILE, ROOT_DIR, QualityCheck, TMXChecker
+
+
+def load_view_exceptions(root_folder: Path):
+    exceptions_path = root_folder / "exceptions" / "view_exceptions.json"
+    if not exceptions_path.exists():
+        return {}
+    with open(exceptions_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_reported(finding, tmx_exclusions, view_exceptions):
+    """Checks if a finding is reported with the current exceptions."""
+    if finding["phase"] in ("tmx", "outliers"):
+        return not any(
+            TMXChecker.is_excluded(
+                finding["string_id"], finding["locale"], tmx_exclusions, exclusion
+            )
+            for exclusion in finding["exclusions"]
+        )
+
+    return not QualityCheck.is_view_exception(
+        finding["check"], finding["string_id"], finding["locale"], view_exceptions
+    )
+
+
+def compare_exceptions(findings, tmx_exclusions, view_exceptions):
+    """
+    Returns errors that would be added (new) or removed (fixed) compared to
+    the last run, if the current exceptions had been used.
+    """
+    new = []
+    fixed = []
+    for finding in findings:
+        reported = is_reported(finding, tmx_exclusions, view_exceptions)
+        if reported == finding["reported"]:
+            continue
+        error = f"{finding['locale']} - {finding['message']}"
+        if reported:
+            new.append(error)
+        else:
+            fixed.append(error)
+
+    return sorted(new), sorted(fixed)
+
+
+def main():
+    cl_parser = argparse.ArgumentParser(
+        description="Apply the current exceptions to the findings of the last "
+        "run, and print errors that would be new or fixed"
+    )
+    cl_parser.add_argument(
+        "--locale", nargs="?", help="Only print changes for this locale"
+    )
+    args = cl_parser.parse_args()
+
+    findings_file = ROOT_DIR / FINDINGS_FILE
+    if not findings_file.exists():
+        sys.exit(f"ERROR: {findings_file} not found, run qualitychecks.py first.")
+    with open(findings_file, encoding="utf-8") as f:
+        findings = json.load(f)["findings"]
+    if args.locale:
+        findings = [f for f in findings if f["locale"] == args.locale]
+
+    try:
+        tmx_exclusions = TMXChecker(
+            tmx_path="", root_folder=ROOT_DIR, excluded_products=()
+        ).load_exclusions()
+        view_exceptions = load_view_exceptions(ROOT_DIR)
+    except json.JSONDecodeError as e:
+        sys.exit(f"ERROR: invalid exceptions file: {e}")
+
+    new, fixed = compare_exceptions(findings, tmx_exclusions, view_exceptions)
+    if new:
+        print(f"New errors ({len(new)}):")
+        print("\n".join(new))
+    if fixed:
+        print(f"Fixed errors ({len(fixed)}):")
+        print("\n".join(fixed))
+    if not new and not fixed:
+        print("No changes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import json
+import shutil
+import sys
+
+from pathlib import Path
+
+import pytest
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_DIR / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+LOCALES = ["de", "fr", "it"]
+
+REFERENCE = {
+    "browser/browser/a.ftl:msg1": 'Hello <a data-l10n-name="link">world</a>',
+    "browser/browser/a.ftl:msg2": "{ NUMBER($n, minimumFractionDigits: 2) } items",
+    "browser/browser/a.ftl:msg3.style": "width: 20em",
+    "browser/browser/a.ftl:msg4": "{ $n ->\n [one] <b>one</b>\n *[other] <b>many</b>\n}",
+    "browser/chrome/b.properties:key1": "Plain %S",
+    "mail/chrome/c.properties:x": "Mail",
+}
+
+TRANSLATIONS = {
+    "de": {
+        "browser/browser/a.ftl:msg1": 'Ciao <a data-l10n-name="lnk">mondo</a> ¶',
+        "browser/browser/a.ftl:msg2": '{ "x" } &amp; %S',
+        "browser/browser/a.ftl:msg3.style": "width: 25em",
+    },
+    "fr": REFERENCE,
+    "it": {
+        "browser/browser/a.ftl:msg1": 'Ciao <a data-l10n-name="lnk">mondo</a>',
+        "browser/browser/a.ftl:msg2": "{ NUMBER($n) } elementi",
+        "browser/browser/a.ftl:msg4": "{ $n ->\n [one] <i>uno</i>\n *[other] "
+        "<b>tanti</b>\n}",
+    },
+}
+
+ENUS_FILES = {
+    "_configs/browser.toml": 'basepath = ".."\n'
+    'locales = ["de", "fr", "it"]\n\n'
+    "[env]\n"
+    '    l = "{l10n_base}/{locale}/"\n\n'
+    "[[paths]]\n"
+    '    reference = "browser/**"\n'
+    '    l10n = "{l}browser/**"\n',
+    "browser/browser/a.ftl": "msg1 = Hello { $name }\nmsg2 = World\n",
+    "browser/chrome/b.properties": "k1 = Hello %S\n",
+}
+
+L10N_FILES = {
+    "de": {
+        "browser/browser/a.ftl": "msg1 = Hallo { $name }\nmsg2 = Welt {\n",
+        "browser/chrome/b.properties": "k1 = Hallo %S %S\n",
+    },
+    "fr": {
+        "browser/browser/a.ftl": "msg1 = Salut { $name }\nmsg2 = Monde\n",
+        "browser/chrome/b.properties": "k1 = Salut %S\n",
+    },
+    "it": {
+        "browser/browser/a.ftl": "msg1 = Ciao { $nome }\nmsg2 = Mondo\nmsg3 = Extra\n",
+        "browser/chrome/b.properties": "k1 = Ciao %S %S\n",
+    },
+}
+
+
+def write_files(base_path, files):
+    for name, content in files.items():
+        path = base_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def l10n_tree(tmp_path):
+    """
+    Small TMX caches, en-US and l10n repositories for 3 locales, and a root
+    folder with the checks and exceptions of the repository.
+    """
+    from tmx_cache import cache_path
+
+    tmx_path = tmp_path / "tmx"
+    for locale, translations in dict(TRANSLATIONS, **{"en-US": REFERENCE}).items():
+        cache_file = cache_path(tmx_path, locale)
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(json.dumps(translations), encoding="utf-8")
+
+    write_files(tmp_path / "en-US", ENUS_FILES)
+    for locale, files in L10N_FILES.items():
+        write_files(tmp_path / "l10n" / locale, files)
+
+    root_folder = tmp_path / "root"
+    for folder in ("checks", "exceptions"):
+        shutil.copytree(REPO_DIR / folder, root_folder / folder)
+
+    return {
+        "root_folder": str(root_folder),
+        "tmx_path": str(tmx_path),
+        "firefoxl10n_path": str(tmp_path / "l10n"),
+        "toml_path": str(tmp_path / "en-US" / "_configs" / "browser.toml"),
+    }
@@ -0,0 +1,47 @@
+import json
+import subprocess
+import sys
+
+from conftest import SCRIPTS_DIR
+
+
+# Maximum time (in seconds) to import qualitychecks.py
+IMPORT_TIME_BUDGET = 0.3
+
+# Modules only needed by some phases, loaded when they run
+LAZY_MODULES = ("compare_locales", "fluent", "urllib.request")
+
+IMPORT_SCRIPT = f"""
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import qualitychecks
+duration = time.perf_counter() - start_time
+loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]
+print(json.dumps({{"duration": duration, "loaded": loaded}}))
+"""
+
+
+def import_qualitychecks():
+    """Imports qualitychecks in a new interpreter, to measure a cold import."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+def test_import_time_budget():
+    # Use the best of a few runs, to ignore noise from the host
+    duration = min(import_qualitychecks()["duration"] for _ in range(3))
+    assert duration < IMPORT_TIME_BUDGET
+
+
+def test_heavy_modules_not_imported():
+    assert import_qualitychecks()["loaded"] == []
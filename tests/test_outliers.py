@@ -0,0 +1,80 @@
+import json
+import random
+
+import outliers
+import pytest
+
+from outliers import OutlierDetector
+from tmx_cache import cache_path
+
+
+def write_caches(tmx_path, num_strings=300, num_locales=12):
+    """en-US and translations, with outliers in the first locale."""
+    rng = random.Random(1)
+    words = ["word", "string", "text", "firefox", "tab"]
+    reference = {}
+    for i in range(num_strings):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(2, 12)))
+        if i % 7 == 0:
+            text += " { $count }"
+        if i % 11 == 0:
+            text = f'<a data-l10n-name="x">{text}</a>'
+        reference[f"browser/browser/f{i % 20}.ftl:msg{i}"] = text
+    ids = list(reference)
+
+    locales = [f"l{i:02d}" for i in range(num_locales)]
+    caches = {"en-US": reference}
+    for locale in locales:
+        caches[locale] = {
+            sid: text.replace("word", "wort" * rng.randint(1, 2))
+            for sid, text in reference.items()
+        }
+    caches["l00"].update(
+        {
+            ids[1]: reference[ids[1]] * 5,
+            ids[7]: reference[ids[7]].replace("{ $count }", ""),
+            ids[11]: reference[ids[11]].replace("</a>", ""),
+            ids[22]: "x",
+        }
+    )
+
+    cache_files = {}
+    for locale, translations in caches.items():
+        cache_file = cache_path(tmx_path, locale)
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(json.dumps(translations), encoding="utf-8")
+        cache_files[locale] = cache_file
+
+    return reference, {loc: cache_files[loc] for loc in locales}
+
+
+def find_outliers(reference, cache_files):
+    detector = OutlierDetector(reference)
+    detector.load(cache_files)
+
+    return detector.find_outliers(list(cache_files))
+
+
+def test_find_outliers(tmp_path, monkeypatch):
+    monkeypatch.setattr(outliers, "numpy", None)
+    reference, cache_files = write_caches(tmp_path)
+    ids = list(reference)
+
+    found = find_outliers(reference, cache_files)
+    assert found.pop("l00") == [
+        (ids[1], f"Translation much longer than in other locales ({ids[1]})"),
+        (ids[7], f"Fewer placeables than en-US and other locales ({ids[7]})"),
+        (ids[11], f"Fewer markup elements than en-US and other locales ({ids[11]})"),
+        (ids[22], f"Translation much shorter than in other locales ({ids[22]})"),
+        (ids[22], f"Fewer markup elements than en-US and other locales ({ids[22]})"),
+    ]
+    assert all(not errors for errors in found.values())
+
+
+def test_vectorized_matches_fallback(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    reference, cache_files = write_caches(tmp_path)
+
+    vectorized = find_outliers(reference, cache_files)
+    monkeypatch.setattr(outliers, "numpy", None)
+    assert vectorized == find_outliers(reference, cache_files)
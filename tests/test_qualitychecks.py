@@ -0,0 +1,141 @@
+import io
+import json
+import pickle
+import urllib.request
+
+from pathlib import Path
+
+import pytest
+
+from conftest import LOCALES
+from qualitychecks import QualityCheck
+
+
+def get_cli_options(**options):
+    return dict(
+        {
+            "verbose": False,
+            "tmx": False,
+            "ignore_comparelocales": False,
+            "locale": None,
+            "phases": ["tmx", "compare-locales"],
+            "sequential": True,
+            "shard": None,
+        },
+        **options,
+    )
+
+
+def mock_transvision(monkeypatch, locales):
+    """Replaces requests to Transvision, only the list of locales is needed."""
+
+    def urlopen(url):
+        assert url.endswith("/locales/gecko_strings/")
+        return io.BytesIO(json.dumps(locales + ["en-US"]).encode("utf-8"))
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+
+
+@pytest.fixture
+def transvision(monkeypatch):
+    mock_transvision(monkeypatch, LOCALES)
+
+
+def run_checks(l10n_tree, output_path, **options):
+    Path(output_path).mkdir(exist_ok=True)
+    return QualityCheck(
+        requested_check="all",
+        cli_options=get_cli_options(**options),
+        output_path=str(output_path),
+        **l10n_tree,
+    )
+
+
+def load_previous_errors(root_folder, name="previous_errors.dump"):
+    with open(Path(root_folder) / name, "rb") as f:
+        return pickle.load(f)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_full_run(l10n_tree, transvision, tmp_path, stream):
+    qc = run_checks(l10n_tree, tmp_path / "output", stream=stream)
+
+    assert qc.locales == LOCALES
+    # Requests for the list of locales are counted
+    assert qc.results.stats["requests"] == 1
+
+    previous_errors = load_previous_errors(
+        l10n_tree["root_folder"], qc.get_state_name("previous_errors.dump")
+    )
+    assert any(e.startswith("de - ") for e in previous_errors["errors"])
+    assert any(e.startswith("it - ") for e in previous_errors["errors"])
+    assert previous_errors["compare-locales"]
+    with open(tmp_path / "output" / "errors.json", encoding="utf-8") as f:
+        assert json.load(f)["errors"] == previous_errors["errors"]
+
+
+def test_phase_runs_keep_separate_results(l10n_tree, transvision, tmp_path):
+    root_folder = Path(l10n_tree["root_folder"])
+    qc = run_checks(l10n_tree, tmp_path / "output")
+    assert qc.get_run_name() == "full-phase-tmx+compare-locales"
+    previous_errors = load_previous_errors(
+        root_folder, "previous_errors_full-phase-tmx+compare-locales.dump"
+    )
+
+    qc = run_checks(l10n_tree, tmp_path / "output", phases=["tmx"])
+    assert qc.get_run_name() == "full-phase-tmx"
+    assert (
+        load_previous_errors(
+            root_folder, "previous_errors_full-phase-tmx+compare-locales.dump"
+        )
+        == previous_errors
+    )
+    assert not load_previous_errors(root_folder, "previous_errors_full-phase-tmx.dump")[
+        "compare-locales"
+    ]
+    # Only full runs with all phases store results for what_if.py, and
+    # replace the results of the previous full run
+    assert not (root_folder / "previous_errors.dump").exists()
+    assert not (root_folder / "last_findings.json").exists()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_merged_shards_match_single_run(l10n_tree, monkeypatch, tmp_path, stream):
+    from merge_shards import load_shards, merge_shards
+    from qualitychecks import ResultsArchiver
+
+    # compare-locales also checks l10n folders of locales not in Transvision
+    mock_transvision(monkeypatch, ["de", "fr"])
+
+    qc = run_checks(l10n_tree, tmp_path / "single")
+    single = load_previous_errors(
+        l10n_tree["root_folder"], qc.get_state_name("previous_errors.dump")
+    )
+    single_findings = list(qc.get_findings())
+
+    shard_files = []
+    for index in (1, 2):
+        run_checks(l10n_tree, tmp_path / "shards", shard=(index, 2), stream=stream)
+        shard_files.append(tmp_path / "shards" / f"partial_results_{index}_of_2.json")
+    merged = merge_shards(load_shards(shard_files))
+    merged_folder = tmp_path / "merged"
+    merged_folder.mkdir()
+    ResultsArchiver(root_folder=merged_folder, output_path="").archive(
+        current_error_messages=merged.error_messages,
+        output_cl=merged.output_cl,
+        error_summary=merged.error_summary,
+    )
+
+    assert load_previous_errors(merged_folder) == single
+    assert sorted(map(json.dumps, merged.findings)) == sorted(
+        map(json.dumps, single_findings)
+    )
+
+
+def test_identical_strings_counted_once(l10n_tree, transvision, tmp_path, capsys):
+    run_checks(l10n_tree, tmp_path / "output", verbose=True)
+
+    # fr is identical to en-US, msg1 is compared for HTML and data-l10n-name
+    assert (
+        "skipped comparison for 4 strings identical to en-US" in capsys.readouterr().out
+    )
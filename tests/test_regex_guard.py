@@ -0,0 +1,89 @@
+import pickle
+import re
+import time
+
+import pytest
+
+from regex_guard import RegexGuard, find_backtracking_risks
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(a+)*",
+        r"(?:a+)+b",
+        r"(?:a+a)+",
+        r"(?i)(?:x+X)+",
+        r"(?:x+y?)+",
+        r"(?:x+|y)+",
+        r"(?:(?:x+)+y)+",
+    ],
+)
+def test_backtracking_risks(pattern):
+    assert find_backtracking_risks(pattern) == ["nested quantifiers"]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"a+b+",
+        r"(?:ab)+",
+        # Repetitions ending with a literal that the inner repeat can't match
+        r"(?:x+y)+",
+        r"(x+y)+",
+        r"(?:[a-z]+,)+",
+        r"(?:[^,]+,)+",
+        r"(?:\d+\.)+\d+",
+        # Possessive repeats and atomic groups don't backtrack
+        r"(?:a++)+",
+        r"(?>a+)+",
+    ],
+)
+def test_no_backtracking_risks(pattern):
+    assert find_backtracking_risks(pattern) == []
+
+
+def test_backtracking_risks_invalid_pattern():
+    with pytest.raises(re.error):
+        find_backtracking_risks(r"(a+")
+
+
+def test_search():
+    guard = RegexGuard()
+
+    assert guard.search(r"(?i)mondo", "Ciao MONDO")
+    assert guard.search(r"%S", "Ciao") is False
+    # Nested quantifiers without catastrophic backtracking are evaluated
+    assert guard.search(r"(?:x+y)+", "xxy xy")
+    assert guard.search(r"(?:x+y)+", "xxx") is False
+    assert guard.pop_offenders() == []
+
+
+def test_search_over_budget():
+    guard = RegexGuard(time_budget=0.2)
+
+    start_time = time.monotonic()
+    assert guard.search(r"(a|aa)*b", "a" * 100) is None
+    assert time.monotonic() - start_time < 5
+    assert guard.pop_offenders() == ["Regex exceeded the time budget (0.2 s): (a|aa)*b"]
+
+    # Following searches still run, the pattern over budget is skipped
+    assert guard.search(r"b", "abc")
+    assert guard.pop_offenders() == []
+    start_time = time.monotonic()
+    assert guard.search(r"(a|aa)*b", "a" * 100) is None
+    assert time.monotonic() - start_time < 0.1
+    assert guard.pop_offenders() == ["Regex exceeded the time budget (0.2 s): (a|aa)*b"]
+
+
+def test_invalid_pattern():
+    guard = RegexGuard()
+
+    with pytest.raises(re.error):
+        guard.search(r"(", "text")
+
+
+def test_pickle():
+    guard = pickle.loads(pickle.dumps(RegexGuard()))
+
+    assert guard.search(r"b", "abc")
@@ -0,0 +1,65 @@
+import json
+import tracemalloc
+
+import pytest
+
+from tmx_cache import iter_cache, load_cache
+
+
+def write_cache(cache_file, num_strings):
+    translations = {
+        f"browser/chrome/file{i % 100}.properties:key{i}": f"Translation {i} " * 10
+        for i in range(num_strings)
+    }
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(translations, f, indent=2)
+
+    return translations
+
+
+def test_load_cache_peak_memory(tmp_path):
+    cache_file = tmp_path / "cache_it_gecko_strings.json"
+    write_cache(cache_file, 100_000)
+    file_size = cache_file.stat().st_size
+    keep = {f"browser/chrome/file{i % 100}.properties:key{i}" for i in range(100)}
+
+    tracemalloc.start()
+    try:
+        translations = load_cache(cache_file, keep=keep)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(translations) == 100
+    # Only a few chunks are in memory at once, never the entire file
+    assert file_size > 10_000_000
+    assert peak < 1_000_000
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_load_cache_small_chunks(tmp_path, chunk_size):
+    cache_file = tmp_path / "cache_it_gecko_strings.json"
+    translations = {
+        "browser/file.ftl:message": 'Escaped \\" quote and \\u00e8 {"a": 1}',
+        "browser/file.ftl:number": "1234567890",
+        "browser/file.ftl:empty": "",
+        "browser/file.ftl:unicode": "Ελληνικά 日本語 🦊",
+        "dom/file.properties:key": "Line\nbreak\ttab",
+    }
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(translations, f, ensure_ascii=False, indent=4)
+    with open(cache_file, encoding="utf-8") as f:
+        expected = json.load(f)
+
+    assert load_cache(cache_file, chunk_size=chunk_size) == expected
+    assert list(iter_cache(cache_file, chunk_size)) == list(expected.items())
+    assert load_cache(
+        cache_file, keep=lambda s: s.startswith("dom/"), chunk_size=chunk_size
+    ) == {"dom/file.properties:key": "Line\nbreak\ttab"}
+
+
+def test_load_cache_empty(tmp_path):
+    cache_file = tmp_path / "cache_it_gecko_strings.json"
+    cache_file.write_text("{ }", encoding="utf-8")
+
+    assert load_cache(cache_file, chunk_size=1) == {}
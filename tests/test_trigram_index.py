@@ -0,0 +1,44 @@
+import re
+
+import pytest
+
+from trigram_index import LocaleIndex, get_required_trigrams, get_trigrams
+
+
+class Guard:
+    def search(self, pattern, text):
+        return re.search(pattern, text)
+
+
+@pytest.mark.parametrize(
+    "pattern, text",
+    [
+        # Sigma is final or not depending on the following character
+        ("(?i)ΟΔΟΣ", "ΟΔΟΣΤΡΩΜΑ"),
+        ("(?i)οδοσ", "ΟΔΟΣ"),
+        # Dotted and dotless i (Turkish, Azerbaijani)
+        ("(?i)istanbul", "İstanbul"),
+        ("(?i)ıstanbul", "Istanbul"),
+        ("(?i)İstanbul", "ıstanbul"),
+        ("(?i)firefox", "FİREFOX"),
+        ("(?i)STRASSE", "strasse"),
+        ("(?i)mondo", "Ciao MONDO"),
+        ("http(s)?://", "Visit https://example.com"),
+    ],
+)
+def test_candidates_include_matches(pattern, text):
+    assert re.search(pattern, text)
+    assert get_required_trigrams(pattern) <= get_trigrams(text)
+
+    index = LocaleIndex(["a.ftl:id"], [text], {})
+    for trigram in get_trigrams(text):
+        index.postings.setdefault(trigram, []).append(0)
+    assert list(index.search(pattern, "*", Guard())) == ["a.ftl:id"]
+
+
+def test_candidates_exclude_missing_literals():
+    index = LocaleIndex(["a.ftl:id"], ["Ciao mondo"], {})
+    for trigram in get_trigrams("Ciao mondo"):
+        index.postings.setdefault(trigram, []).append(0)
+
+    assert list(index.candidates("(?i)hello")) == []